@@ -15,6 +15,10 @@ class GenderEnum(str, PyEnum):
     female = "여성"
 
 
+# DB enum 값 목록 (모듈 로드 시 한 번만 계산)
+_GENDER_VALUES = tuple(member.value for member in GenderEnum)
+
+
 class User(Base):
     __tablename__ = "users"  # 테이블 이름
     id = Column(Integer, primary_key=True, index=True)  # 고유 식별자
@@ -28,7 +32,7 @@ class User(Base):
         SQLEnum(
             GenderEnum,
             name="genderenum",
-            values_callable=lambda enum: [member.value for member in enum],
+            values_callable=lambda _enum: _GENDER_VALUES,
         ),
         nullable=True,
     )
@@ -0,0 +1,119 @@
+import functools
+import hashlib
+import re
+
+from sqlalchemy import Enum
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.schema import CreateTable
+
+# --- 테스트 DB 생성/삭제 헬퍼 ---
+# DB URL에서 DB 이름을 뽑는 정규식 (모듈 로드 시 한 번만 컴파일)
+_DB_NAME_RE = re.compile(r".*//.*:.*@.*/(.*)")
+
+
+# TEST_DATABASE_URL은 상수이므로 URL 파싱 결과는 캐시
+@functools.lru_cache(maxsize=4)
+def extract_db_name(url: str) -> str | None:
+    match = _DB_NAME_RE.match(url)
+    return match.group(1) if match else None
+
+
+@functools.lru_cache(maxsize=4)
+def get_admin_db_url(url: str) -> str:
+    base_url = url.rsplit("/", 1)[0]
+    return base_url.replace("postgresql+asyncpg", "postgresql", 1) + "/postgres"
+
+
+def get_db_url(url: str, db_name: str) -> str:
+    return url.rsplit("/", 1)[0] + f"/{db_name}"
+
+
+# 템플릿 DB 이름에서 기본 테스트 DB 이름과 스키마 해시를 잇는 구분자 (<기본>_tpl_<해시>)
+_TEMPLATE_INFIX = "_tpl_"
+
+
+# 현재 모델 스키마(DDL)의 해시를 붙인 템플릿 DB 이름
+# (모델이 바뀌면 이름이 달라져 새 템플릿을 만든다)
+def get_template_db_name(db_name: str, metadata) -> str:
+    dialect = postgresql.dialect()
+    ddl = "\n".join(
+        str(CreateTable(table).compile(dialect=dialect))
+        for table in metadata.sorted_tables
+    )
+    # 네이티브 ENUM 타입의 값 목록은 CREATE TABLE에 드러나지 않으므로 따로 포함
+    enums = sorted(
+        f"{column.type.name}:{','.join(column.type.enums)}"
+        for table in metadata.sorted_tables
+        for column in table.columns
+        if isinstance(column.type, Enum)
+    )
+    ddl += "\n" + "\n".join(enums)
+    digest = hashlib.sha1(ddl.encode("utf-8")).hexdigest()[:8]
+    return f"{db_name}{_TEMPLATE_INFIX}{digest}"
+
+
+async def database_exists(conn, db_name: str) -> bool:
+    return bool(
+        await conn.fetchval("SELECT 1 FROM pg_database WHERE datname = $1;", db_name)
+    )
+
+
+# 이전 스키마로 만든 템플릿 DB 삭제 (모델이 바뀔 때마다 남는 <기본>_tpl_<옛 해시> 정리)
+async def drop_stale_template_databases(conn, template_name: str):
+    prefix = template_name.rsplit(_TEMPLATE_INFIX, 1)[0] + _TEMPLATE_INFIX
+    stale_names = await conn.fetch(
+        "SELECT datname FROM pg_database"
+        " WHERE left(datname, length($1)) = $1 AND datname <> $2;",
+        prefix,
+        template_name,
+    )
+    for row in stale_names:
+        # 템플릿 표시가 남아 있으면 DROP DATABASE가 거부되므로 먼저 해제
+        await conn.execute(f'ALTER DATABASE "{row["datname"]}" WITH IS_TEMPLATE false;')
+        await drop_test_database(conn, row["datname"])
+
+
+# 스키마가 적용된 템플릿 DB가 없으면 한 번만 생성
+# (xdist 워커들이 동시에 만들거나 지우지 않도록 advisory lock으로 직렬화)
+async def ensure_template_database(
+    conn, template_url: str, template_name: str, metadata
+):
+    # 해시가 달라도 같은 lock을 잡도록 해시를 뺀 접두사 기준으로 잠금
+    lock_key = template_name.rsplit(_TEMPLATE_INFIX, 1)[0]
+    await conn.execute("SELECT pg_advisory_lock(hashtext($1));", lock_key)
+    try:
+        if await database_exists(conn, template_name):
+            return
+        await drop_stale_template_databases(conn, template_name)
+        await conn.execute(f'CREATE DATABASE "{template_name}";')
+        engine = create_async_engine(template_url)
+        try:
+            async with engine.begin() as conn_engine:
+                await conn_engine.run_sync(metadata.create_all)
+        finally:
+            await engine.dispose()
+        await conn.execute(f'ALTER DATABASE "{template_name}" WITH IS_TEMPLATE true;')
+    finally:
+        await conn.execute("SELECT pg_advisory_unlock(hashtext($1));", lock_key)
+
+
+# 템플릿 DB를 복제해 테스트 DB 생성 (이미 있으면 False)
+async def create_test_database(conn, db_name: str, template_name: str) -> bool:
+    if await database_exists(conn, db_name):
+        return False
+    await conn.execute(f'CREATE DATABASE "{db_name}" TEMPLATE "{template_name}";')
+    return True
+
+
+async def drop_test_database(conn, db_name: str):
+    # Postgres 13+는 WITH (FORCE)로 남은 접속 종료와 삭제를 한 번에 처리
+    if conn.get_server_version().major >= 13:
+        await conn.execute(f'DROP DATABASE IF EXISTS "{db_name}" WITH (FORCE);')
+        return
+    await conn.execute(f"""
+        SELECT pg_terminate_backend(pid)
+        FROM pg_stat_activity
+        WHERE datname = '{db_name}' AND pid <> pg_backend_pid();
+    """)
+    await conn.execute(f'DROP DATABASE IF EXISTS "{db_name}";')
@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from sqlalchemy import bindparam, insert
+
+from app.models.users import EmailVerification, GenderEnum, User
+
+# --- 테스트용 모델 팩토리 ---
+# 일반 회원 기본 필드 값 (모듈 로드 시 한 번만 생성, 테스트별 차이는 overrides로 지정)
+_USER_DEFAULTS = {
+    "name": "홍길동",
+    "email": "test@example.com",
+    "password": "hashedpassword",
+    "phone_number": "010-1234-5678",
+    "birthday": "1990-01-01",
+    "gender": GenderEnum.male,
+    "signup_purpose": "정보 탐색",
+    "referral_source": "블로그",
+}
+
+
+def build_user(**overrides) -> User:
+    """DB에 저장하지 않은 User 인스턴스 생성 (저장이 필요하면 호출한 쪽에서 session.add)"""
+    return User(**{**_USER_DEFAULTS, **overrides})
+
+
+# 유효한 이메일 인증 정보의 유효기간 (실행 시각과 무관하도록 고정된 먼 미래)
+VERIFIED_EMAIL_EXPIRES_AT = datetime(2099, 12, 31)
+
+# 인증 완료 상태의 일반 회원 이메일 인증 정보 INSERT 문 (모듈 로드 시 한 번만 구성)
+# 실행 시 email, token, expires_at 값을 파라미터로 넘김
+VERIFIED_EMAIL_INSERT = insert(EmailVerification).values(
+    email=bindparam("email"),
+    token=bindparam("token"),
+    is_verified=True,
+    user_type="user",
+    expires_at=bindparam("expires_at"),
+)
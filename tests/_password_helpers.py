@@ -0,0 +1,11 @@
+# --- 테스트용 가짜 비밀번호 해시 ---
+# bcrypt 대신 평문에 접두사만 붙임 (로그인·가입 테스트는 흐름만 검증하므로 bcrypt 연산이 필요 없음)
+FAKE_HASH_PREFIX = "fakehash:"
+
+
+def fake_hash_password(password: str) -> str:
+    return f"{FAKE_HASH_PREFIX}{password}"
+
+
+def fake_verify_password(password: str, hashed_password: str) -> bool:
+    return hashed_password == f"{FAKE_HASH_PREFIX}{password}"
@@ -2,9 +2,12 @@ import pytest
 from fastapi.testclient import TestClient
 from typing import Dict, Any
 
-from app.main import app
 
-client = TestClient(app)
+@pytest.fixture(scope="module")
+def client(fastapi_app):
+    """AI 요약 API 테스트 클라이언트 (앱은 conftest에서 지연 import)"""
+    return TestClient(fastapi_app)
+
 
 # 유효한 테스트 데이터
 valid_job_data: Dict[str, Any] = {
@@ -45,7 +48,7 @@ negative_salary_data["salary"] = -5000000
         (negative_salary_data, 200),  # 구조상 통과하나 의미상 테스트
     ]
 )
-def test_ai_summarize_input_variants(payload, expected_status):
+def test_ai_summarize_input_variants(client, payload, expected_status):
     response = client.post("/ai/summarize", json=payload)
     assert response.status_code == expected_status
 
@@ -57,7 +60,7 @@ def test_ai_summarize_input_variants(payload, expected_status):
         assert len(data["data"]["summary"]) > 0
 
 
-def test_ai_summarize_output_format():
+def test_ai_summarize_output_format(client):
     """요약문이 '회사이름에서~'로 시작하고 마침표로 끝나는지 확인"""
     response = client.post("/ai/summarize", json=valid_job_data)
     assert response.status_code == 200
@@ -93,7 +96,7 @@ def test_ai_summarize_output_format():
 from unittest.mock import patch,AsyncMock
 
 @patch("app.domains.ai.service.call_clova_summary", new_callable=AsyncMock)
-def test_ai_summarize_clova_empty_response(mock_clova):
+def test_ai_summarize_clova_empty_response(mock_clova, client):
     mock_clova.return_value = ""
 
     response = client.post("/ai/summarize", json=valid_job_data)
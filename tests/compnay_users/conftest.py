@@ -0,0 +1,142 @@
+import copy
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+import app.domains.company_users.router as users_router_module
+from app.core.db import get_db_session
+from app.core.utils import get_current_company_user
+from app.domains.company_users.router import router as users_router
+
+# 라우터 테스트에서 가짜 구현으로 교체하는 라우터 모듈 내 함수 이름
+ROUTER_DEP_NAMES = (
+    "register_company_user",
+    "login_company_user",
+    "create_access_token",
+    "create_refresh_token",
+    "get_company_user_mypage",
+    "update_company_user",
+    "delete_company_user",
+    "find_company_user_email",
+    "refresh_company_user_access_token",
+    "generate_password_reset_token",
+    "reset_password_with_token",
+)
+_ORIGINAL_ROUTER_DEPS = {
+    name: getattr(users_router_module, name) for name in ROUTER_DEP_NAMES
+}
+
+
+# 라우터 의존 함수 네임스페이스 (테스트에서는 속성 대입만으로 교체)
+# 프록시가 없는 이름은 대입 자체가 AttributeError로 실패한다.
+class FakeRouterDeps:
+    __slots__ = ROUTER_DEP_NAMES
+
+    def reset(self):
+        for name, func in _ORIGINAL_ROUTER_DEPS.items():
+            setattr(self, name, func)
+
+
+_FAKE_ROUTER_DEPS = FakeRouterDeps()
+_FAKE_ROUTER_DEPS.reset()
+
+
+def _make_router_dep_proxy(name):
+    async def proxy(*args, **kwargs):
+        return await getattr(_FAKE_ROUTER_DEPS, name)(*args, **kwargs)
+
+    return proxy
+
+
+# 토큰 발급 mock 원본 (테스트마다 copy.copy로 복제해 호출 기록을 분리)
+_ACCESS_TOKEN_MOCK = AsyncMock(return_value="ATOKEN")
+_REFRESH_TOKEN_MOCK = AsyncMock(return_value="RTOKEN")
+
+
+# 라우터 테스트용 더미 DB 세션 (의존성 오버라이드용)
+class RouterDummySession:
+    pass
+
+
+# 라우터 테스트용 더미 로그인 유저의 기업 정보 (모든 인스턴스가 공유)
+_ROUTER_DUMMY_COMPANY = SimpleNamespace(
+    company_name="CoName",
+    manager_name="MgrName",
+    manager_phone="01012345678",
+    manager_email="mgr@co.com",
+    business_reg_number="1234567890",
+    opening_date="20200101",
+    ceo_name="CEOName",
+    company_intro="테스트 회사 소개글입니다.",  # 10자 이상
+    address=None,
+    company_image=None,
+    job_postings=[],
+)
+
+
+# 라우터 테스트용 더미 로그인 유저
+class RouterDummyUser:
+    def __init__(self):
+        self.id = 7
+        self.email = "u@co.com"
+        self.company = _ROUTER_DUMMY_COMPANY
+
+
+# 의존성 오버라이드가 매 요청 돌려줄 상태 없는 싱글턴
+_ROUTER_DUMMY_SESSION = RouterDummySession()
+_ROUTER_DUMMY_USER = RouterDummyUser()
+
+
+# 기업 회원 라우터만 등록한 테스트 앱
+@pytest.fixture(scope="session")
+def users_app():
+    app = FastAPI()
+    # response_model 검증은 그대로 두므로 가짜 구현도 스키마에 맞는 값을 돌려줘야 함
+    app.include_router(users_router)
+    app.dependency_overrides[get_db_session] = lambda: _ROUTER_DUMMY_SESSION
+    app.dependency_overrides[get_current_company_user] = lambda: _ROUTER_DUMMY_USER
+    return app
+
+
+# 세션 동안 한 번만 열어 두고 재사용하는 클라이언트
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def users_client(users_app):
+    transport = ASGITransport(app=users_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+# 테스트마다 의존성 오버라이드 상태 복원
+@pytest.fixture
+def restore_users_dependency_overrides(users_app):
+    saved = users_app.dependency_overrides.copy()
+    yield
+    users_app.dependency_overrides = saved
+
+
+# 라우터 모듈의 함수들을 이 패키지 테스트 동안 한 번만 프록시로 교체
+@pytest.fixture(scope="package")
+def patched_router_deps():
+    with pytest.MonkeyPatch.context() as mp:
+        for name in ROUTER_DEP_NAMES:
+            mp.setattr(users_router_module, name, _make_router_dep_proxy(name))
+        yield _FAKE_ROUTER_DEPS
+
+
+# 테스트에서 교체한 함수는 테스트 종료 시 원래 함수로 복원
+@pytest.fixture
+def fake_deps(patched_router_deps):
+    yield patched_router_deps
+    patched_router_deps.reset()
+
+
+# 라우터의 토큰 발급 함수를 고정 토큰을 돌려주는 mock으로 교체
+@pytest.fixture
+def token_mocks(fake_deps):
+    fake_deps.create_access_token = copy.copy(_ACCESS_TOKEN_MOCK)
+    fake_deps.create_refresh_token = copy.copy(_REFRESH_TOKEN_MOCK)
+    return fake_deps.create_access_token, fake_deps.create_refresh_token
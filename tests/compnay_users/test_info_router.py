@@ -1,6 +1,7 @@
 import pytest
+import pytest_asyncio
 from fastapi import Depends, FastAPI, HTTPException
-from starlette.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from app.core.db import get_db_session
 from app.domains.company_info.router import router as company_router
@@ -8,7 +9,7 @@ from app.domains.company_info.schemas import PublicCompanyInfo
 
 
 # 더미 DB 세션 픽스처
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
     app = FastAPI()
     app.include_router(company_router)
@@ -21,7 +22,24 @@ def app():
     return app
 
 
-def test_get_companyinfo_success(monkeypatch, app):
+# 세션 동안 한 번만 열어 두고 재사용하는 클라이언트
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(app):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+# 테스트마다 의존성 오버라이드 상태 복원
+@pytest.fixture(autouse=True)
+def restore_dependency_overrides(app):
+    saved = app.dependency_overrides.copy()
+    yield
+    app.dependency_overrides = saved
+
+
+@pytest.mark.asyncio
+async def test_get_companyinfo_success(monkeypatch, client):
     """GET /companies/{id} 성공 케이스"""
     dummy = PublicCompanyInfo(
         company_id=1,
@@ -46,8 +64,7 @@ def test_get_companyinfo_success(monkeypatch, app):
         fake_service,
     )
 
-    client = TestClient(app)
-    r = client.get("/companies/1")
+    r = await client.get("/companies/1")
     assert r.status_code == 200
     body = r.json()
     assert body["status"] == "success"
@@ -55,7 +72,8 @@ def test_get_companyinfo_success(monkeypatch, app):
     assert body["data"]["company_name"] == "테스트사"
 
 
-def test_get_companyinfo_not_found(monkeypatch, app):
+@pytest.mark.asyncio
+async def test_get_companyinfo_not_found(monkeypatch, client):
     """GET /companies/{id} 404 케이스"""
 
     async def fake_service(db, company_id: int):
@@ -66,7 +84,6 @@ def test_get_companyinfo_not_found(monkeypatch, app):
         fake_service,
     )
 
-    client = TestClient(app)
-    r = client.get("/companies/999")
+    r = await client.get("/companies/999")
     assert r.status_code == 404
     assert r.json()["detail"] == "기업 정보를 찾을 수 없습니다."
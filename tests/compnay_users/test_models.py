@@ -14,7 +14,7 @@ from app.models.company_users import CompanyUser
 def db_session():
     # 1) 메모리 SQLite 엔진 & 세션 팩토리 생성
     engine = create_engine("sqlite:///:memory:", echo=False)
-    Session = sessionmaker(bind=engine)
+    Session = sessionmaker(bind=engine, expire_on_commit=False)
 
     # 2) 테이블 생성
     Base.metadata.create_all(engine)
@@ -42,8 +42,7 @@ def test_companyinfo_model_fields_and_str(db_session):
     )
 
     db_session.add(company)
-    db_session.commit()  # 동기 커밋
-    db_session.refresh(company)  # 동기 리프레시
+    db_session.commit()  # 동기 커밋 (expire_on_commit=False라 refresh 불필요)
 
     # 검증
     assert company.id is not None
@@ -67,7 +66,6 @@ def test_create_company_user_with_relation(db_session):
     )
     db_session.add(company)
     db_session.commit()
-    db_session.refresh(company)
 
     # 2) CompanyUser 생성
     user = CompanyUser(
@@ -77,7 +75,6 @@ def test_create_company_user_with_relation(db_session):
     )
     db_session.add(user)
     db_session.commit()
-    db_session.refresh(user)
 
     # 검증
     assert user.id is not None
@@ -1,78 +1,27 @@
-
+import copy
+import json
+from types import SimpleNamespace
 
 import pytest
-from fastapi import FastAPI, HTTPException
-from starlette.testclient import TestClient
-
-from app.core.db import get_db_session
-from app.core.utils import get_current_company_user
-from app.domains.company_users.router import router as users_router
-from app.domains.company_users.schemas import (
-    PasswordResetVerifyRequest,
-)
+from fastapi import HTTPException
 
+from app.domains.company_users.schemas import PasswordResetVerifyRequest
 
-# 더미 DB 세션 (의존성 오버라이드용)
-class DummySession:
-    pass
-
-
-# 더미 로그인된 유저
-class DummyUser:
-    def __init__(self):
-        self.id = 7
-        self.email = "u@co.com"
-        self.company = type(
-            "C",
-            (),
-            {
-                "company_name": "CoName",
-                "manager_name": "MgrName",
-                "manager_phone": "01012345678",
-                "manager_email": "mgr@co.com",
-                "business_reg_number": "1234567890",
-                "opening_date": "20200101",
-                "ceo_name": "CEOName",
-                "company_intro": "테스트 회사 소개글입니다.",  # 10자 이상
-                "address": None,
-                "company_image": None,
-                "job_postings": [],
-            },
-        )
-
+# fake_login이 돌려주는 유저의 기업 정보
+_LOGIN_COMPANY = SimpleNamespace(company_name="Co")
+# fake_login이 email만 바꿔 복제해 쓰는 유저 템플릿
+_LOGIN_USER_TEMPLATE = SimpleNamespace(id=5, email=None, company=_LOGIN_COMPANY)
 
-@pytest.fixture
-def app():
-    app = FastAPI()
-    app.include_router(users_router)
-    app.dependency_overrides[get_db_session] = lambda: DummySession()
-    app.dependency_overrides[get_current_company_user] = lambda: DummyUser()
-    return app
+# 요청 본문은 모듈 로드 시 한 번만 JSON 직렬화해 재사용
+_JSON_HEADERS = {"content-type": "application/json"}
 
 
-@pytest.fixture
-def client(app):
-    return TestClient(app)
+def _encode(body: dict) -> bytes:
+    return json.dumps(body, ensure_ascii=False).encode("utf-8")
 
 
-def test_register_companyuser(monkeypatch, client):
-    """POST /company/register"""
-
-    async def fake_register(db, payload):
-        class CU:
-            pass
-
-        u = CU()
-        u.id = 42
-        u.email = payload.email
-        u.company_name = payload.company_name
-        return u
-
-    monkeypatch.setattr(
-        "app.domains.company_users.router.register_company_user",
-        fake_register,
-    )
-    body = {
+_REGISTER_BODY = _encode(
+    {
         "email": "new@co.com",
         "manager_name": "매니저",
         "manager_phone": "01012345678",
@@ -85,61 +34,108 @@ def test_register_companyuser(monkeypatch, client):
         "password": "pass1234",
         "confirm_password": "pass1234",
     }
-    r = client.post("/company/register", json=body)
+)
+_LOGIN_BODY = _encode({"email": "u@co.com", "password": "pwd"})
+_PATCH_ME_BODY = _encode({"manager_name": "새매니저"})
+_FIND_EMAIL_BODY = _encode(
+    {
+        "business_reg_number": "123",
+        "opening_date": "20200101",
+        "ceo_name": "홍대표",
+    }
+)
+_REFRESH_BODY = _encode({"refresh_token": "rtoken"})
+_RESET_VERIFY_BODY = _encode(
+    {
+        "business_reg_number": "123",
+        "opening_date": "20200101",
+        "ceo_name": "CEO",
+        "email": "a@b.com",
+    }
+)
+_RESET_PASSWORD_BODY = _encode(
+    {
+        "reset_token": "tok",
+        "new_password": "abcdefgh",
+        "confirm_password": "abcdefgh",
+    }
+)
+
+# 엔드포인트별 (메서드, 경로, 본문) 요청 튜플
+_REQ_REGISTER = ("POST", "/company/register", _REGISTER_BODY)
+_REQ_LOGIN = ("POST", "/company/login", _LOGIN_BODY)
+_REQ_LOGOUT = ("POST", "/company/logout", None)
+_REQ_GET_ME = ("GET", "/company/me", None)
+_REQ_PATCH_ME = ("PATCH", "/company/me", _PATCH_ME_BODY)
+_REQ_DELETE_ME = ("DELETE", "/company/me", None)
+_REQ_FIND_EMAIL = ("POST", "/company/find-email", _FIND_EMAIL_BODY)
+_REQ_REFRESH = ("POST", "/company/auth/refresh-token", _REFRESH_BODY)
+_REQ_RESET_VERIFY = ("POST", "/company/reset-password/verify", _RESET_VERIFY_BODY)
+_REQ_RESET_PASSWORD = ("POST", "/company/reset-password", _RESET_PASSWORD_BODY)
+
+
+def _send(client, req):
+    method, url, body = req
+    if body is None:
+        return client.request(method, url)
+    return client.request(method, url, content=body, headers=_JSON_HEADERS)
+
+
+# 테스트마다 의존성 오버라이드와 교체한 라우터 함수를 원복
+@pytest.fixture(autouse=True)
+def reset_router_state(restore_users_dependency_overrides, fake_deps):
+    yield
+
+
+@pytest.mark.asyncio
+async def test_register_companyuser(fake_deps, users_client):
+    """POST /company/register"""
+
+    async def fake_register(db, payload):
+        return SimpleNamespace(
+            id=42, email=payload.email, company_name=payload.company_name
+        )
+
+    fake_deps.register_company_user = fake_register
+    r = await _send(users_client, _REQ_REGISTER)
     assert r.status_code == 201
     data = r.json()["data"]
     assert data["company_user_id"] == 42
     assert data["email"] == "new@co.com"
 
 
-def test_login_companyuser(monkeypatch, client):
+@pytest.mark.asyncio
+async def test_login_companyuser(fake_deps, token_mocks, users_client):
     """POST /company/login"""
 
     async def fake_login(db, email, password):
-        class U:
-            pass
-
-        u = U()
-        u.id = 5
-        u.email = email
-        u.company = type("X", (), {"company_name": "Co"})
-        return u
-
-    async def fake_create_access_token(data):
-        return "ATOKEN"
-
-    async def fake_create_refresh_token(data):
-        return "RTOKEN"
-
-    monkeypatch.setattr(
-        "app.domains.company_users.router.login_company_user",
-        fake_login,
-    )
-    monkeypatch.setattr(
-        "app.domains.company_users.router.create_access_token",
-        fake_create_access_token,
-    )
-    monkeypatch.setattr(
-        "app.domains.company_users.router.create_refresh_token",
-        fake_create_refresh_token,
-    )
-
-    r = client.post("/company/login", json={"email": "u@co.com", "password": "pwd"})
+        user = copy.copy(_LOGIN_USER_TEMPLATE)
+        user.email = email
+        return user
+
+    fake_deps.login_company_user = fake_login
+
+    r = await _send(users_client, _REQ_LOGIN)
     assert r.status_code == 200
     d = r.json()["data"]
     assert d["access_token"] == "ATOKEN"
     assert d["refresh_token"] == "RTOKEN"
     assert d["company_user_id"] == 5
+    access_mock, refresh_mock = token_mocks
+    access_mock.assert_awaited_once_with(data={"sub": "u@co.com"})
+    refresh_mock.assert_awaited_once_with(data={"sub": "u@co.com"})
 
 
-def test_logout_companyuser(client):
+@pytest.mark.asyncio
+async def test_logout_companyuser(users_client):
     """POST /company/logout"""
-    r = client.post("/company/logout")
+    r = await _send(users_client, _REQ_LOGOUT)
     assert r.status_code == 200
     assert r.json()["message"].startswith("로그아웃")
 
 
-def test_get_me(monkeypatch, client):
+@pytest.mark.asyncio
+async def test_get_me(fake_deps, users_client):
     """GET /company/me"""
 
     async def fake_mypage(db, user):
@@ -160,16 +156,14 @@ def test_get_me(monkeypatch, client):
             "job_postings": user.company.job_postings,
         }
 
-    monkeypatch.setattr(
-        "app.domains.company_users.router.get_company_user_mypage",
-        fake_mypage,
-    )
-    r = client.get("/company/me")
+    fake_deps.get_company_user_mypage = fake_mypage
+    r = await _send(users_client, _REQ_GET_ME)
     assert r.status_code == 200
     assert r.json()["data"]["company_user_id"] == 7
 
 
-def test_patch_me(monkeypatch, client):
+@pytest.mark.asyncio
+async def test_patch_me(fake_deps, users_client):
     """PATCH /company/me"""
 
     async def fake_update(db, payload, current_user):
@@ -185,61 +179,47 @@ def test_patch_me(monkeypatch, client):
             "company_image": current_user.company.company_image,
         }
 
-    monkeypatch.setattr(
-        "app.domains.company_users.router.update_company_user",
-        fake_update,
-    )
-    r = client.patch("/company/me", json={"manager_name": "새매니저"})
+    fake_deps.update_company_user = fake_update
+    r = await _send(users_client, _REQ_PATCH_ME)
     assert r.status_code == 200
     assert r.json()["data"]["manager_name"] == "새매니저"
 
 
-def test_delete_me(monkeypatch, client):
+@pytest.mark.asyncio
+async def test_delete_me(fake_deps, users_client):
     """DELETE /company/me"""
 
     async def fake_delete(db, current_user):
         return {"company_user_id": current_user.id}
 
-    monkeypatch.setattr(
-        "app.domains.company_users.router.delete_company_user",
-        fake_delete,
-    )
-    r = client.delete("/company/me")
+    fake_deps.delete_company_user = fake_delete
+    r = await _send(users_client, _REQ_DELETE_ME)
     assert r.status_code == 200
     assert r.json()["data"]["company_user_id"] == 7
 
 
-def test_find_email(monkeypatch, client):
+@pytest.mark.asyncio
+async def test_find_email(fake_deps, users_client):
     """POST /company/find-email"""
 
     async def fake_find(db, payload):
         return {"email": "found@co.com", "company_name": "FCo"}
 
-    monkeypatch.setattr(
-        "app.domains.company_users.router.find_company_user_email",
-        fake_find,
-    )
-    body = {
-        "business_reg_number": "123",
-        "opening_date": "20200101",
-        "ceo_name": "홍대표",
-    }
-    r = client.post("/company/find-email", json=body)
+    fake_deps.find_company_user_email = fake_find
+    r = await _send(users_client, _REQ_FIND_EMAIL)
     assert r.status_code == 200
     assert r.json()["data"]["email"] == "found@co.com"
 
 
-def test_refresh_token(monkeypatch, client):
+@pytest.mark.asyncio
+async def test_refresh_token(fake_deps, users_client):
     """POST /company/auth/refresh-token"""
 
     async def fake_refresh(db, token_data):
         return {"access_token": "NEWAT"}
 
-    monkeypatch.setattr(
-        "app.domains.company_users.router.refresh_company_user_access_token",
-        fake_refresh,
-    )
-    r = client.post("/company/auth/refresh-token", json={"refresh_token": "rtoken"})
+    fake_deps.refresh_company_user_access_token = fake_refresh
+    r = await _send(users_client, _REQ_REFRESH)
     assert r.status_code == 200
     assert r.json()["data"]["access_token"] == "NEWAT"
 
@@ -247,94 +227,65 @@ def test_refresh_token(monkeypatch, client):
 # ==== 비밀번호 재설정 라우터 테스트 추가 ====
 
 
-def test_verify_reset_password_success(monkeypatch, client):
-    """POST /company/reset-password/verify 성공"""
-    sample_token = "tok"
+async def fake_gen_reset_token(db, payload):
+    assert isinstance(payload, PasswordResetVerifyRequest)
+    return "tok"
 
-    async def fake_gen(db, payload):
-        assert isinstance(payload, PasswordResetVerifyRequest)
-        return sample_token
 
-    monkeypatch.setattr(
-        "app.domains.company_users.router.generate_password_reset_token",
-        fake_gen,
-    )
-    body = {
-        "business_reg_number": "123",
-        "opening_date": "20200101",
-        "ceo_name": "CEO",
-        "email": "a@b.com",
-    }
-    r = client.post("/company/reset-password/verify", json=body)
-    assert r.status_code == 200
+async def fake_gen_reset_token_fail(db, payload):
+    raise HTTPException(status_code=404, detail="fail")
+
+
+@pytest.mark.parametrize(
+    "fake_gen, expected_status",
+    [(fake_gen_reset_token, 200), (fake_gen_reset_token_fail, 404)],
+    ids=["success", "fail"],
+)
+@pytest.mark.asyncio
+async def test_verify_reset_password(
+    fake_deps, users_client, fake_gen, expected_status
+):
+    """POST /company/reset-password/verify 성공 / 검증 실패 → 404"""
+    fake_deps.generate_password_reset_token = fake_gen
+    r = await _send(users_client, _REQ_RESET_VERIFY)
+    assert r.status_code == expected_status
     j = r.json()
-    assert j["status"] == "success"
-    assert j["data"]["reset_token"] == sample_token
-
-
-def test_verify_reset_password_fail(monkeypatch, client):
-    """POST /company/reset-password/verify 검증 실패 → 404"""
-
-    async def fake_err(db, payload):
-        raise HTTPException(status_code=404, detail="fail")
-
-    monkeypatch.setattr(
-        "app.domains.company_users.router.generate_password_reset_token",
-        fake_err,
-    )
-    r = client.post(
-        "/company/reset-password/verify",
-        json={
-            "business_reg_number": "x",
-            "opening_date": "y",
-            "ceo_name": "z",
-            "email": "u@u.com",
-        },
-    )
-    assert r.status_code == 404
-    assert r.json()["detail"] == "fail"
-
-
-def test_reset_password_success(monkeypatch, client):
+    if expected_status == 200:
+        assert j["status"] == "success"
+        assert j["data"]["reset_token"] == "tok"
+    else:
+        assert j["detail"] == "fail"
+
+
+@pytest.mark.asyncio
+async def test_reset_password_success(fake_deps, users_client):
     """POST /company/reset-password 성공"""
 
     async def fake_reset(db, token, new, confirm):
         return None
 
-    monkeypatch.setattr(
-        "app.domains.company_users.router.reset_password_with_token",
-        fake_reset,
-    )
-    r = client.post(
-        "/company/reset-password",
-        json={
-            "reset_token": "tok",
-            "new_password": "abcdefgh",
-            "confirm_password": "abcdefgh",
-        },
-    )
+    fake_deps.reset_password_with_token = fake_reset
+    r = await _send(users_client, _REQ_RESET_PASSWORD)
     assert r.status_code == 200
     assert r.json()["status"] == "success"
 
 
-@pytest.mark.parametrize("code", [400, 401, 404])
-def test_reset_password_error(monkeypatch, client, code):
-    """POST /company/reset-password 에러 전파"""
+# 에러 코드별 reset_password_with_token 가짜 구현
+@pytest.fixture(params=[400, 401, 404])
+def reset_password_error(request):
+    code = request.param
 
     async def fake_err(db, token, new, confirm):
         raise HTTPException(status_code=code, detail="err")
 
-    monkeypatch.setattr(
-        "app.domains.company_users.router.reset_password_with_token",
-        fake_err,
-    )
-    r = client.post(
-        "/company/reset-password",
-        json={
-            "reset_token": "tok",
-            "new_password": "abcdefgh",
-            "confirm_password": "abcdefgh",
-        },
-    )
+    return code, fake_err
+
+
+@pytest.mark.asyncio
+async def test_reset_password_error(fake_deps, users_client, reset_password_error):
+    """POST /company/reset-password 에러 전파"""
+    code, fake_err = reset_password_error
+    fake_deps.reset_password_with_token = fake_err
+    r = await _send(users_client, _REQ_RESET_PASSWORD)
     assert r.status_code == code
     assert r.json()["detail"] == "err"
@@ -1,13 +1,14 @@
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
+from unittest import mock
 
-import bcrypt
 import jwt
 import pytest
 from fastapi import HTTPException, status
 
 import app.core.config as cfg
 import app.domains.company_users.service as svc
+import app.domains.company_users.utiles as utiles
 from app.domains.company_users.schemas import (
     CompanyTokenRefreshRequest,
     FindCompanyUserEmail,
@@ -23,15 +24,53 @@ from app.domains.company_users.service import (
     reset_password_with_token,
 )
 
+# --- 테스트에서 재사용하는 고정 요청 스키마 (모듈 로드 시 한 번만 검증) ---
+_FIND_EMAIL_PAYLOAD = FindCompanyUserEmail(
+    ceo_name="X", opening_date="20200101", business_reg_number="0000000000"
+)
+_REFRESH_PAYLOAD = CompanyTokenRefreshRequest(refresh_token="rt")
+_RESET_VERIFY_PAYLOAD = PasswordResetVerifyRequest(
+    business_reg_number="123",
+    opening_date="20200101",
+    ceo_name="CEO",
+    email="a@b.com",
+)
+_RESET_VERIFY_UNKNOWN_PAYLOAD = PasswordResetVerifyRequest(
+    business_reg_number="xxx",
+    opening_date="19000101",
+    ceo_name="X",
+    email="no@one.com",
+)
+
+
+# --- 비밀번호 재설정 토큰 (모듈 로드 시 한 번만 서명) ---
+# 만료 여부만 중요하므로 현재 시각 대신 고정된 먼 미래/과거 시각 사용
+_FAR_FUTURE = datetime(2999, 1, 1)
+_FAR_PAST = datetime(1970, 1, 1, 0, 0, 1)
+
+
+def _reset_token(sub, scope="reset", exp=_FAR_FUTURE):
+    return jwt.encode(
+        {"sub": sub, "scope": scope, "exp": exp},
+        "testsecret",
+        algorithm="HS256",
+    )
+
+
+_VALID_RESET_TOKEN = _reset_token("x@y.com")
+_USER_RESET_TOKEN = _reset_token("u@u.com")
+_EXPIRED_RESET_TOKEN = _reset_token("u@u.com", exp=_FAR_PAST)
+_SCOPE_MISMATCH_TOKEN = _reset_token("u@u.com", scope="other")
+_NOUSER_RESET_TOKEN = _reset_token("nouser@co.com")
+
 
 # --- 더미 ORM 유저 & 결과 & 세션 정의 ---
 class DummyUser:
     def __init__(self, email, raw_password=None):
         self.email = email
         if raw_password is not None:
-            self.password = bcrypt.hashpw(
-                raw_password.encode(), bcrypt.gensalt()
-            ).decode()
+            # tests/_password_helpers.py의 fake_verify_password가 비교하는 가짜 해시 형식
+            self.password = f"fakehash:{raw_password}"
         self.id = 1
 
 
@@ -52,9 +91,11 @@ class DummyResult:
 class DummySession:
     def __init__(self, val):
         self.val = val
+        # 같은 값만 돌려주므로 결과 객체는 한 번만 생성
+        self._result = DummyResult(val)
 
     async def execute(self, query):
-        return DummyResult(self.val)
+        return self._result
 
     async def commit(self):
         self.committed = True
@@ -66,120 +107,118 @@ class DummySession:
         pass
 
 
-# --- JWT 설정 픽스처 (서비스 모듈까지 덮어쓰기) ---
-@pytest.fixture(autouse=True)
-def jwt_settings(monkeypatch):
-    monkeypatch.setenv("SECRET_KEY", "testsecret")
-    monkeypatch.setenv("ALGORITHM", "HS256")
-    # core.config 덮어쓰기
-    cfg.SECRET_KEY = "testsecret"
-    cfg.ALGORITHM = "HS256"
-    # service 모듈 상수도 덮어쓰기
-    svc.SECRET_KEY = "testsecret"
-    svc.ALGORITHM = "HS256"
+# --- 더미 세션 픽스처 ---
+@pytest.fixture
+def empty_session():
+    return DummySession(None)
 
 
-# ==== 중복 검사 테스트 ====
-@pytest.mark.asyncio
-async def test_check_dupl_email_conflict():
-    db = DummySession(object())
-    with pytest.raises(HTTPException) as exc:
-        await dup_email(db, "a@b.com")
-    assert exc.value.status_code == status.HTTP_409_CONFLICT
+@pytest.fixture
+def user_session():
+    return DummySession(DummyUser("u@u.com", raw_password="password1"))
 
 
-@pytest.mark.asyncio
-async def test_check_dupl_email_ok():
-    db = DummySession(None)
-    await dup_email(db, "new@b.com")
+# --- JWT 설정 픽스처 (서비스 모듈까지 덮어쓰기) ---
+# 모든 테스트가 같은 값을 쓰므로 모듈 단위로 한 번만 적용하고 끝나면 원복
+@pytest.fixture(scope="module", autouse=True)
+def jwt_settings():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SECRET_KEY", "testsecret")
+        mp.setenv("ALGORITHM", "HS256")
+        # core.config 덮어쓰기
+        mp.setattr(cfg, "SECRET_KEY", "testsecret")
+        mp.setattr(cfg, "ALGORITHM", "HS256")
+        # service 모듈 상수도 덮어쓰기
+        mp.setattr(svc, "SECRET_KEY", "testsecret")
+        mp.setattr(svc, "ALGORITHM", "HS256")
+        yield
 
 
+# ==== 중복 검사 테스트 ====
 @pytest.mark.asyncio
-async def test_check_dupl_brn_conflict():
+@pytest.mark.parametrize(
+    "check_fn, value",
+    [(dup_email, "a@b.com"), (dup_brn, "1234567890")],
+    ids=["email", "brn"],
+)
+async def test_check_dupl_conflict(check_fn, value):
     db = DummySession(object())
     with pytest.raises(HTTPException) as exc:
-        await dup_brn(db, "1234567890")
+        await check_fn(db, value)
     assert exc.value.status_code == status.HTTP_409_CONFLICT
 
 
 @pytest.mark.asyncio
-async def test_check_dupl_brn_ok():
-    db = DummySession(None)
-    await dup_brn(db, "0987654321")
+@pytest.mark.parametrize(
+    "check_fn, value",
+    [(dup_email, "new@b.com"), (dup_brn, "0987654321")],
+    ids=["email", "brn"],
+)
+async def test_check_dupl_ok(check_fn, value, empty_session):
+    await check_fn(empty_session, value)
 
 
 # ==== 로그인 테스트 ====
 @pytest.mark.asyncio
-async def test_login_company_user_not_found():
-    db = DummySession(None)
+async def test_login_company_user_not_found(empty_session):
     with pytest.raises(HTTPException) as exc:
-        await login_company_user(db, "no@one.com", "pwd")
+        await login_company_user(empty_session, "no@one.com", "pwd")
     assert exc.value.status_code == status.HTTP_404_NOT_FOUND
 
 
 @pytest.mark.asyncio
-async def test_login_company_user_bad_password():
-    dummy = DummyUser("u@u.com", raw_password="rightpw")
-    db = DummySession(dummy)
+async def test_login_company_user_bad_password(user_session):
     with pytest.raises(HTTPException) as exc:
-        await login_company_user(db, "u@u.com", "wrongpw")
+        await login_company_user(user_session, "u@u.com", "wrongpw")
     assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
 
 
 @pytest.mark.asyncio
-async def test_login_company_user_success():
-    dummy = DummyUser("u@u.com", raw_password="password1")
-    db = DummySession(dummy)
-    user = await login_company_user(db, "u@u.com", "password1")
+async def test_login_company_user_success(user_session):
+    user = await login_company_user(user_session, "u@u.com", "password1")
     assert user.email == "u@u.com"
 
 
+# 서비스의 해시/검증은 가짜로 바꿔 두었으므로 실제 bcrypt 헬퍼는 여기서 한 번만 확인
+def test_real_bcrypt_once():
+    hashed = utiles.hash_password("password1")
+    assert utiles.verify_password("password1", hashed)
+    assert not utiles.verify_password("wrongpw", hashed)
+
+
 # ==== 이메일 찾기 테스트 ====
 @pytest.mark.asyncio
-async def test_find_company_user_email_not_found():
-    db = DummySession(None)
-    payload = FindCompanyUserEmail(
-        ceo_name="X", opening_date="20200101", business_reg_number="0000000000"
-    )
+async def test_find_company_user_email_not_found(empty_session):
     with pytest.raises(HTTPException) as exc:
-        await find_company_user_email(db, payload)
+        await find_company_user_email(empty_session, _FIND_EMAIL_PAYLOAD)
     assert exc.value.status_code == status.HTTP_404_NOT_FOUND
 
 
 # ==== 토큰 재발급 테스트 ====
 @pytest.mark.asyncio
-async def test_refresh_company_user_access_token_not_found(monkeypatch):
-    monkeypatch.setattr(
-        "app.domains.company_users.service.decode_refresh_token",
-        lambda t: {"sub": "no@user.com"},
-    )
-    db = DummySession(None)
-    with pytest.raises(HTTPException) as exc:
-        await refresh_company_user_access_token(
-            db, CompanyTokenRefreshRequest(refresh_token="rt")
-        )
+async def test_refresh_company_user_access_token_not_found(empty_session):
+    with mock.patch.multiple(
+        svc, decode_refresh_token=lambda t: {"sub": "no@user.com"}
+    ):
+        with pytest.raises(HTTPException) as exc:
+            await refresh_company_user_access_token(empty_session, _REFRESH_PAYLOAD)
     assert exc.value.status_code == status.HTTP_404_NOT_FOUND
 
 
 @pytest.mark.asyncio
-async def test_refresh_company_user_access_token_success(monkeypatch):
-    monkeypatch.setattr(
-        "app.domains.company_users.service.decode_refresh_token",
-        lambda t: {"sub": "ok@user.com"},
-    )
-
+async def test_refresh_company_user_access_token_success():
     async def fake_create_access_token(data):
         return "NEWAT"
 
-    monkeypatch.setattr(
-        "app.domains.company_users.service.create_access_token",
-        fake_create_access_token,
-    )
     dummy = DummyUser("ok@user.com")
     db = DummySession(dummy)
-    result = await refresh_company_user_access_token(
-        db, CompanyTokenRefreshRequest(refresh_token="rt")
-    )
+    # 두 함수를 한 번에 교체/복원
+    with mock.patch.multiple(
+        svc,
+        decode_refresh_token=lambda t: {"sub": "ok@user.com"},
+        create_access_token=fake_create_access_token,
+    ):
+        result = await refresh_company_user_access_token(db, _REFRESH_PAYLOAD)
     assert result["access_token"] == "NEWAT"
 
 
@@ -188,13 +227,7 @@ async def test_refresh_company_user_access_token_success(monkeypatch):
 async def test_generate_password_reset_token_success():
     user = DummyUser("a@b.com")  # raw_password 생략 가능
     db = DummySession(user)
-    payload = PasswordResetVerifyRequest(
-        business_reg_number="123",
-        opening_date="20200101",
-        ceo_name="CEO",
-        email="a@b.com",
-    )
-    token = await generate_password_reset_token(db, payload)
+    token = await generate_password_reset_token(db, _RESET_VERIFY_PAYLOAD)
     data = jwt.decode(token, "testsecret", algorithms=["HS256"])
     assert data["sub"] == "a@b.com"
     assert data["scope"] == "reset"
@@ -202,16 +235,11 @@ async def test_generate_password_reset_token_success():
 
 
 @pytest.mark.asyncio
-async def test_generate_password_reset_token_not_found():
-    db = DummySession(None)
-    payload = PasswordResetVerifyRequest(
-        business_reg_number="xxx",
-        opening_date="19000101",
-        ceo_name="X",
-        email="no@one.com",
-    )
+async def test_generate_password_reset_token_not_found(empty_session):
     with pytest.raises(HTTPException) as exc:
-        await generate_password_reset_token(db, payload)
+        await generate_password_reset_token(
+            empty_session, _RESET_VERIFY_UNKNOWN_PAYLOAD
+        )
     assert exc.value.status_code == status.HTTP_404_NOT_FOUND
 
 
@@ -220,87 +248,32 @@ async def test_generate_password_reset_token_not_found():
 async def test_reset_password_with_token_success():
     user = DummyUser("x@y.com")
     db = DummySession(user)
-    now = datetime.utcnow()
-    token = jwt.encode(
-        {"sub": user.email, "scope": "reset", "exp": now + timedelta(minutes=1)},
-        "testsecret",
-        algorithm="HS256",
-    )
-    await reset_password_with_token(db, token, "newpass12", "newpass12")
+    await reset_password_with_token(db, _VALID_RESET_TOKEN, "newpass12", "newpass12")
     assert getattr(db, "committed", False) is True
 
 
 @pytest.mark.asyncio
-async def test_reset_password_with_token_expired():
-    user = DummyUser("u@u.com")
-    db = DummySession(user)
-    past = datetime.utcnow() - timedelta(seconds=1)
-    token = jwt.encode(
-        {"sub": user.email, "scope": "reset", "exp": past},
-        "testsecret",
-        algorithm="HS256",
-    )
-    with pytest.raises(HTTPException) as exc:
-        await reset_password_with_token(db, token, "abcdefgh", "abcdefgh")
-    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
-
-
-@pytest.mark.asyncio
-async def test_reset_password_with_token_invalid():
-    db = DummySession(DummyUser("u@u.com"))
-    with pytest.raises(HTTPException) as exc:
-        await reset_password_with_token(db, "not.a.token", "abcdefgh", "abcdefgh")
-    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
-
-
-@pytest.mark.asyncio
-async def test_reset_password_with_token_scope_mismatch():
-    user = DummyUser("u@u.com")
-    db = DummySession(user)
-    token = jwt.encode(
-        {
-            "sub": user.email,
-            "scope": "other",
-            "exp": datetime.utcnow() + timedelta(minutes=1),
-        },
-        "testsecret",
-        algorithm="HS256",
-    )
-    with pytest.raises(HTTPException) as exc:
-        await reset_password_with_token(db, token, "abcdefgh", "abcdefgh")
-    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
-
-
-@pytest.mark.asyncio
-async def test_reset_password_with_token_user_not_found():
-    token = jwt.encode(
-        {
-            "sub": "nouser@co.com",
-            "scope": "reset",
-            "exp": datetime.utcnow() + timedelta(minutes=1),
-        },
-        "testsecret",
-        algorithm="HS256",
-    )
-    db = DummySession(None)
-    with pytest.raises(HTTPException) as exc:
-        await reset_password_with_token(db, token, "abcdefgh", "abcdefgh")
-    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
-
-
-@pytest.mark.asyncio
-async def test_reset_password_with_token_mismatch_passwords():
-    user = DummyUser("u@u.com")
-    db = DummySession(user)
-    token = jwt.encode(
-        {
-            "sub": user.email,
-            "scope": "reset",
-            "exp": datetime.utcnow() + timedelta(minutes=1),
-        },
-        "testsecret",
-        algorithm="HS256",
-    )
+@pytest.mark.parametrize(
+    "token, new_password, confirm_password, has_user, expected_status",
+    [
+        (_EXPIRED_RESET_TOKEN, "abcdefgh", "abcdefgh", True, 401),
+        ("not.a.token", "abcdefgh", "abcdefgh", True, 401),
+        (_SCOPE_MISMATCH_TOKEN, "abcdefgh", "abcdefgh", True, 401),
+        (_NOUSER_RESET_TOKEN, "abcdefgh", "abcdefgh", False, 404),
+        (_USER_RESET_TOKEN, "abc12345", "xyz98765", True, 400),
+    ],
+    ids=["expired", "invalid", "scope_mismatch", "user_not_found", "mismatch"],
+)
+async def test_reset_password_with_token_error(
+    token,
+    new_password,
+    confirm_password,
+    has_user,
+    expected_status,
+    user_session,
+    empty_session,
+):
+    db = user_session if has_user else empty_session
     with pytest.raises(HTTPException) as exc:
-        await reset_password_with_token(db, token, "abc12345", "xyz98765")
-    assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
+        await reset_password_with_token(db, token, new_password, confirm_password)
+    assert exc.value.status_code == expected_status
@@ -1,78 +1,132 @@
 import os
-import re
 import uuid
 
 import asyncpg
 import pytest
 import pytest_asyncio  # 명시적으로 import
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.db import get_db_session
 from app.core.utils import create_access_token
-from app.main import app
 from app.models import User
 from app.models.base import Base
 from app.models.users import GenderEnum
+from tests._db_helpers import (
+    create_test_database,
+    drop_test_database,
+    ensure_template_database,
+    extract_db_name,
+    get_admin_db_url,
+    get_db_url,
+    get_template_db_name,
+)
+from tests._password_helpers import fake_hash_password, fake_verify_password
 
 # --- 테스트 DB URL 설정  ---
-TEST_DATABASE_URL = os.getenv("DATABASE_URL", "") + "_test"
+# pytest-xdist(pytest -n auto)로 실행하면 워커마다 별도 DB 사용 (예: ..._test_gw0)
+_XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+# 워커 접미사가 붙기 전 기본 테스트 DB URL (스키마 템플릿 DB 이름은 이 기준으로 만들어 워커들이 공유)
+BASE_TEST_DATABASE_URL = os.getenv("DATABASE_URL", "") + "_test"
+TEST_DATABASE_URL = BASE_TEST_DATABASE_URL
+if _XDIST_WORKER:
+    TEST_DATABASE_URL += f"_{_XDIST_WORKER}"
+SQLITE_TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# 세션 공유 테스트 유저 이메일 (실행마다 한 번만 생성)
+_SHARED_USER_EMAIL = f"testuser_{uuid.uuid4().hex[:8]}@example.com"
 
-# --- 헬퍼 함수 정의  ---
-def extract_db_name(url: str) -> str | None:
-    match = re.match(r".*//.*:.*@.*/(.*)", url)
-    return match.group(1) if match else None
 
+# 앱의 get_db_session 오버라이드가 넘겨줄 현재 테스트의 DB 세션 (async_client가 교체)
+_CURRENT_DB_SESSION: dict[str, AsyncSession] = {}
 
-def get_admin_db_url(url: str) -> str:
-    base_url = url.rsplit("/", 1)[0]
-    return base_url.replace("postgresql+asyncpg", "postgresql", 1) + "/postgres"
 
+async def _override_get_db():
+    """get_db_session 대신 현재 테스트의 db_session을 제공"""
+    yield _CURRENT_DB_SESSION["session"]
 
-async def create_test_database(conn, db_name: str):
-    existing = await conn.fetch("SELECT datname FROM pg_database;")
-    if db_name not in [row["datname"] for row in existing]:
-        await conn.execute(f'CREATE DATABASE "{db_name}";')
 
+# --- FIXTURE 정의 ---
 
-async def drop_test_database(conn, db_name: str):
-    await conn.execute(
-        f"""
-        SELECT pg_terminate_backend(pid)
-        FROM pg_stat_activity
-        WHERE datname = '{db_name}' AND pid <> pg_backend_pid();
-    """
-    )
-    await conn.execute(f'DROP DATABASE IF EXISTS "{db_name}";')
 
+# 일반/기업 회원 서비스의 비밀번호 해시/검증을 테스트 세션 동안 가짜 구현으로 교체
+# (가입·로그인 테스트는 흐름만 검증하므로 요청마다 bcrypt 연산을 할 필요가 없음)
+@pytest.fixture(scope="session", autouse=True)
+def fake_password_hashing():
+    import app.domains.company_users.service as company_users_service
+    import app.domains.users.service as users_service
 
-# --- FIXTURE 정의 ---
+    with pytest.MonkeyPatch.context() as mp:
+        for module in (users_service, company_users_service):
+            mp.setattr(module, "hash_password", fake_hash_password)
+            mp.setattr(module, "verify_password", fake_verify_password)
+        yield
 
-@pytest_asyncio.fixture(scope="function")
-async def db_engine(event_loop):  # ✨ 여기 event_loop 명시 추가!
-    """테스트 세션마다 DB 생성 및 삭제"""
-    engine = create_async_engine(TEST_DATABASE_URL, future=True)
+
+@pytest.fixture(scope="session")
+def fastapi_app():
+    """FastAPI 앱 (앱이 필요한 테스트에서만 import 비용을 치르도록 지연 import)"""
+    from app.main import app
+
+    return app
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db_engine():  # 이벤트 루프는 pyproject의 세션 루프 설정을 따름
+    """테스트 세션마다 DB 생성 및 삭제 (엔진·테이블 생성은 세션당 한 번)"""
+    # DATABASE_URL은 이미 postgresql+asyncpg 드라이버를 사용 (_db_helpers도 이를 전제)
+    # 시드 픽스처 세션 + 테스트 세션이 동시에 연결을 잡으므로 풀을 넉넉히 고정
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        future=True,
+        pool_size=10,
+        max_overflow=0,
+        pool_pre_ping=False,
+    )
 
     db_name = extract_db_name(TEST_DATABASE_URL)
     admin_url = get_admin_db_url(TEST_DATABASE_URL)
 
+    # 스키마가 적용된 템플릿 DB를 복제하므로 보통은 create_all이 필요 없음
+    # 관리자 연결은 생성~삭제까지 하나만 열어 두고 재사용
+    cloned = False
+    try:
+        admin_conn = await asyncpg.connect(admin_url)
+    except Exception as e:
+        pytest.exit(f"[DB 생성 실패] {e}")
     try:
-        conn = await asyncpg.connect(admin_url)
         if db_name:
-            await create_test_database(conn, db_name)
-        await conn.close()
+            # 템플릿은 워커 접미사 없는 이름으로 만들어 모든 워커가 lock 아래 하나만 복제
+            template_name = get_template_db_name(
+                extract_db_name(BASE_TEST_DATABASE_URL), Base.metadata
+            )
+            await ensure_template_database(
+                admin_conn,
+                get_db_url(TEST_DATABASE_URL, template_name),
+                template_name,
+                Base.metadata,
+            )
+            cloned = await create_test_database(admin_conn, db_name, template_name)
         print(f"테스트 DB '{db_name}' 생성 완료")
     except Exception as e:
+        await admin_conn.close()
         pytest.exit(f"[DB 생성 실패] {e}")
 
-    try:
-        async with engine.begin() as conn_engine:
-            await conn_engine.run_sync(Base.metadata.create_all)
-        print("테이블 생성 완료")
-    except Exception as e:
-        await engine.dispose()
-        pytest.exit(f"[테이블 생성 실패] {e}")
+    # 이전 실행에서 남은 DB를 그대로 쓰는 경우에만 테이블 생성
+    if not cloned:
+        try:
+            async with engine.begin() as conn_engine:
+                await conn_engine.run_sync(Base.metadata.create_all)
+            print("테이블 생성 완료")
+        except Exception as e:
+            await engine.dispose()
+            await admin_conn.close()
+            pytest.exit(f"[테이블 생성 실패] {e}")
+
+    # 첫 테스트가 연결 수립 비용을 떠안지 않도록 풀을 미리 데워 둠
+    async with engine.connect() as conn_engine:
+        await conn_engine.execute(text("SELECT 1"))
 
     yield engine
 
@@ -88,73 +142,134 @@ async def db_engine(event_loop):  # ✨ 여기 event_loop 명시 추가!
     print("엔진 종료 완료")
 
     try:
-        conn = await asyncpg.connect(admin_url)
         if db_name:
-            await drop_test_database(conn, db_name)
-        await conn.close()
+            await drop_test_database(admin_conn, db_name)
         print(f"테스트 DB '{db_name}' 삭제 완료")
     except Exception as e:
         print(f"[DB 삭제 실패] {e}")
+    finally:
+        await admin_conn.close()
 
 
 @pytest_asyncio.fixture(scope="function")
 async def db_session(db_engine):
-    """함수마다 DB 세션 제공"""
-    TestingSessionLocal = async_sessionmaker(
-        bind=db_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-    )
-    async with TestingSessionLocal() as session:
-        yield session
-        await session.rollback()
+    """함수마다 DB 세션 제공 (테스트가 끝나면 바깥 트랜잭션을 롤백해 데이터 원복)"""
+    async with db_engine.connect() as conn:
+        trans = await conn.begin()
+        # 세션의 commit은 SAVEPOINT 해제로만 처리되어 바깥 트랜잭션은 유지됨
+        TestingSessionLocal = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+        async with TestingSessionLocal() as session:
+            yield session
+        # 세션 종료 후 바깥 트랜잭션만 롤백하면 테스트 데이터가 모두 원복됨
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def sqlite_engine():
+    """Postgres 전용 기능이 필요 없는 모델 테스트용 인메모리 SQLite 엔진"""
+    engine = create_async_engine(SQLITE_TEST_DATABASE_URL)
+
+    # SQLite 드라이버의 자체 트랜잭션 처리를 끄고 BEGIN을 직접 보내야 SAVEPOINT가 동작함
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transaction(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="function")
-async def async_client(db_session: AsyncSession):
-    """함수마다 테스트 클라이언트 제공 및 DB 세션 오버라이드"""
+async def sqlite_session(sqlite_engine):
+    """함수마다 SQLite 세션 제공 (테스트가 끝나면 바깥 트랜잭션을 롤백해 데이터 원복)"""
+    async with sqlite_engine.connect() as conn:
+        trans = await conn.begin()
+        TestingSessionLocal = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+        async with TestingSessionLocal() as session:
+            yield session
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_client(fastapi_app):
+    """세션 동안 한 번만 만들어 재사용하는 테스트 클라이언트"""
+    # app에 대한 상태가 없으므로 모든 async_client가 공유 (httpx는 lifespan을 실행하지 않음)
+    # uvicorn 없이 ASGITransport로 앱을 프로세스 안에서 직접 호출 (소켓/HTTP 파싱 비용 없음)
+    transport = ASGITransport(app=fastapi_app)
+    # get_db_session 오버라이드는 세션당 한 번만 등록하고, 테스트마다 세션만 교체
+    fastapi_app.dependency_overrides[get_db_session] = _override_get_db
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        # Starlette는 첫 요청 때 미들웨어 스택을 만들므로, DB를 쓰지 않는 루트 경로로 미리 한 번 호출
+        # (첫 테스트가 이 비용을 떠안지 않도록)
+        await client.get("/")
+        yield client
+    fastapi_app.dependency_overrides.pop(get_db_session, None)
 
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
 
-    app.dependency_overrides[get_db_session] = override_get_db
+@pytest_asyncio.fixture(scope="function")
+async def async_client(shared_client: AsyncClient, db_session: AsyncSession):
+    """함수마다 현재 DB 세션을 교체한 뒤 공유 테스트 클라이언트 제공"""
+    _CURRENT_DB_SESSION["session"] = db_session
 
-    transport = ASGITransport(app=app)  # transport를 직접 사용
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        yield client
+    yield shared_client
 
-    app.dependency_overrides.clear()
+    _CURRENT_DB_SESSION.pop("session", None)
+    shared_client.cookies.clear()  # 다음 테스트로 쿠키가 넘어가지 않도록
 
 
-@pytest_asyncio.fixture
-async def user_token_and_id(db_session):
+@pytest_asyncio.fixture(scope="session")
+async def user_token_and_id(db_engine):
     """
-    랜덤 이메일을 가진 테스트 유저 생성 후 JWT 토큰 발급하는 fixture
+    세션 동안 공유하는 테스트 유저 생성 후 JWT 토큰 발급하는 fixture
+    (테스트 안에서의 수정/삭제는 db_session의 롤백으로 원복됨)
     """
-    random_email = f"testuser_{uuid.uuid4().hex[:8]}@example.com"
-
-    # 1. 유저를 생성
-    user = User(
-        name="테스트유저",
-        email=random_email,
-        password="securepassword",
-        gender=GenderEnum.male,
-        phone_number="010-1234-5678",
-        birthday="1990-01-01",
-        signup_purpose="테스트 목적",
-        referral_source="구글 검색",
-        is_active=True,
+    # 1. 유저를 생성 (db_session 롤백에 묶이지 않도록 별도 세션에서 커밋)
+    TestingSessionLocal = async_sessionmaker(
+        bind=db_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
     )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)  # ID값을 가져오기 위해 refresh
+    async with TestingSessionLocal() as session:
+        user = User(
+            name="테스트유저",
+            email=_SHARED_USER_EMAIL,
+            password="securepassword",
+            gender=GenderEnum.male,
+            phone_number="010-1234-5678",
+            birthday="1990-01-01",
+            signup_purpose="테스트 목적",
+            referral_source="구글 검색",
+            is_active=True,
+        )
+        session.add(user)
+        await session.commit()  # expire_on_commit=False라 refresh 없이 user.id 사용
 
     # 2. JWT 토큰 생성 (!!! 여기 반드시 await 해야 함)
     token = await create_access_token(data={"sub": str(user.id)})  # 꼭 sub를 문자열로
 
     # 3. token, id, email 리턴
     return token, user.id, user.email
+
+
+@pytest.fixture(scope="session")
+def user_auth_headers(user_token_and_id):
+    """공유 테스트 유저의 Authorization 헤더 (토큰이 바뀌지 않으므로 세션당 한 번만 생성)"""
+    token, _, _ = user_token_and_id
+    return {"Authorization": f"Bearer {token}"}
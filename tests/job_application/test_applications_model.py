@@ -1,84 +1,117 @@
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.exc import IntegrityError
 from datetime import date
 
 from app.models import JobApplication, Resume, JobPosting, User, CompanyInfo, CompanyUser
+from app.models.base import Base
 from app.models.job_applications import ApplicationStatusEnum
 from app.models.job_postings import WorkDurationEnum, JobCategoryEnum, PaymentMethodEnum, EducationEnum
 
 
-@pytest.mark.asyncio
-async def test_model_create_and_query(db_session: AsyncSession):
+@pytest_asyncio.fixture(scope="module")
+async def app_fk_graph(sqlite_engine):
     """
-    JobApplication 모델의 생성 및 조회 기능 테스트
+    JobApplication이 참조하는 유저/기업/공고/이력서를 모듈당 한 번만 생성
+    (테스트별 JobApplication은 sqlite_session 롤백으로 원복됨)
     """
-    # 사용자 및 공고, 이력서 생성
-    user = User(name="A", email="a@test.com", password="pwd")
-    db_session.add(user)
-    await db_session.commit()
-    # 기업 정보 및 기업 유저 생성
-    company = CompanyInfo(
-        company_name="테스트기업",
-        ceo_name="홍대표",
-        business_reg_number="1234567890",
-        opening_date="2020-01-01",
-        company_intro="테스트 기업 소개",
-        manager_name="김담당",
-        manager_phone="01012345678",
-        manager_email="hr@test.com"
+    TestingSessionLocal = async_sessionmaker(
+        bind=sqlite_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
     )
-    db_session.add(company)
-    await db_session.flush()  # company.id 확보
+    async with TestingSessionLocal() as session:
+        # 사용자 및 공고, 이력서 생성
+        user = User(name="A", email="a@test.com", password="pwd")
+        # 기업 정보 및 기업 유저 생성
+        company = CompanyInfo(
+            company_name="테스트기업",
+            ceo_name="홍대표",
+            business_reg_number="1234567890",
+            opening_date="2020-01-01",
+            company_intro="테스트 기업 소개",
+            manager_name="김담당",
+            manager_phone="01012345678",
+            manager_email="hr@test.com"
+        )
+        session.add_all([user, company])
+        await session.flush()  # user.id, company.id 확보
 
-    company_user = CompanyUser(
-        email="corp@test.com",
-        password="pwd",
-        company_id=company.id
-    )
-    db_session.add(company_user)
-    await db_session.flush()  # company_user.id 확보
+        company_user = CompanyUser(
+            email="corp@test.com",
+            password="pwd",
+            company_id=company.id
+        )
+        resume = Resume(user_id=user.id)  # 빈 이력서 데이터로 초기화
+        session.add_all([company_user, resume])
+        await session.flush()  # company_user.id, resume.id 확보
 
-    posting = JobPosting(
-        title="T",
-        company_id=company.id,
-        author_id=company_user.id,
-        recruit_period_start=date(2025, 5, 1),
-        recruit_period_end=date(2025, 6, 1),
-        is_always_recruiting=False,
-        education=EducationEnum.college_4,
-        recruit_number=1,
-        payment_method=PaymentMethodEnum.monthly,
-        job_category=JobCategoryEnum.it,
-        work_duration=WorkDurationEnum.more_6_months,
-        is_work_duration_negotiable=False,
-        career="무관",
-        employment_type="정규직",
-        salary=3000,
-        work_days="월~금",
-        is_work_days_negotiable=False,
-        is_schedule_based=False,
-        work_address="서울시 강남구",
-        work_place_name="본사",
-        is_work_time_negotiable=False,
-        postings_image="https://example.com/default.png",
-    )
-    db_session.add(posting)
-    await db_session.commit()
-    resume = Resume(user_id=user.id)  # 빈 이력서 데이터로 초기화
-    db_session.add(resume)
-    await db_session.commit()
+        posting = JobPosting(
+            title="T",
+            company_id=company.id,
+            author_id=company_user.id,
+            recruit_period_start=date(2025, 5, 1),
+            recruit_period_end=date(2025, 6, 1),
+            is_always_recruiting=False,
+            education=EducationEnum.college_4,
+            recruit_number=1,
+            payment_method=PaymentMethodEnum.monthly,
+            job_category=JobCategoryEnum.it,
+            work_duration=WorkDurationEnum.more_6_months,
+            is_work_duration_negotiable=False,
+            career="무관",
+            employment_type="정규직",
+            salary=3000,
+            work_days="월~금",
+            is_work_days_negotiable=False,
+            is_schedule_based=False,
+            work_address="서울시 강남구",
+            work_place_name="본사",
+            is_work_time_negotiable=False,
+            postings_image="https://example.com/default.png",
+        )
+        session.add(posting)
+        await session.commit()  # posting.id 확보
+
+    yield user.id, posting.id, resume.id
+
+    # 모듈 종료 시 커밋해 둔 데이터 삭제
+    async with sqlite_engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status, expected_status",
+    [
+        (None, ApplicationStatusEnum.applied),  # 기본 상태
+        (ApplicationStatusEnum.passed, ApplicationStatusEnum.passed),
+        (ApplicationStatusEnum.accepted, ApplicationStatusEnum.accepted),
+        (ApplicationStatusEnum.rejected, ApplicationStatusEnum.rejected),
+    ],
+    ids=["default", "passed", "accepted", "rejected"],
+)
+async def test_model_create_and_query(
+    sqlite_session: AsyncSession, app_fk_graph, status, expected_status
+):
+    """
+    JobApplication 모델의 생성 및 조회 기능 테스트 (Postgres 없이 SQLite로 실행)
+    """
+    user_id, posting_id, resume_id = app_fk_graph
 
     # JobApplication 생성
     app = JobApplication(
-        user_id=user.id,
-        job_posting_id=posting.id,
-        resume_id=resume.id,
+        user_id=user_id,
+        job_posting_id=posting_id,
+        resume_id=resume_id,
         resumes_data={},
     )
-    db_session.add(app)
-    await db_session.commit()
-    await db_session.refresh(app)
+    if status is not None:
+        app.status = status
+    sqlite_session.add(app)
+    await sqlite_session.commit()  # status 기본값은 INSERT 시 채워지므로 refresh 불필요
 
-    assert app.status == ApplicationStatusEnum.applied  # 기본 상태 검증
-    assert app.resume_id == resume.id  # 외래키 연결 검증
\ No newline at end of file
+    assert app.status == expected_status  # 상태 검증
+    assert app.resume_id == resume_id  # 외래키 연결 검증
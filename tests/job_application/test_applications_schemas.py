@@ -1,6 +1,7 @@
 import pytest
 from pydantic import ValidationError
 from datetime import datetime
+from types import SimpleNamespace
 
 from app.domains.job_applications.schemas import (
     ResumeApplyCreate, JobApplicationStatusUpdate, JobApplicationRead, JobPostingSummary
@@ -33,34 +34,35 @@ def test_status_update_valid():
     assert model.status == ApplicationStatusEnum.passed  # 상태 값 검증
 
 
+# 중첩 데이터용 JobPostingSummary (불변이므로 모듈 단위로 한 번만 생성)
+_POSTING_SUMMARY = JobPostingSummary(
+    id=3,
+    title="T1",
+    company_id=2,
+    recruit_period_start=datetime(2025, 5, 1),
+    recruit_period_end=datetime(2025, 6, 1),
+    work_address="서울",
+    work_place_name="본사",
+)
+_NOW = datetime(2025, 1, 1)
+
+
 def test_job_application_read_from_orm():
     """
     JobApplicationRead 모델이 ORM 객체로부터 생성되는지 테스트
     """
-    # Create a JobPostingSummary Pydantic model instance for nested data
-    posting_summary = JobPostingSummary(
-        title="T1",
-        company_id=2,
-        recruit_period_start=datetime(2025, 5, 1),
-        recruit_period_end=datetime(2025, 6, 1),
-        work_address="서울",
-        work_place_name="본사",
-    )
-
     # Create a dummy ORM-like object with attributes matching JobApplicationRead
-    orm_obj = type(
-        "O", (), {
-            "id": 1,
-            "user_id": 2,
-            "job_posting_id": 3,
-            "job_posting": posting_summary,
-            "resumes_data": {},
-            "status": ApplicationStatusEnum.applied,
-            "email_sent": True,
-            "created_at": datetime.now(),
-            "updated_at": datetime.now(),
-        }
-    )()
+    orm_obj = SimpleNamespace(
+        id=1,
+        user_id=2,
+        job_posting_id=3,
+        job_posting=_POSTING_SUMMARY,
+        resumes_data={},
+        status=ApplicationStatusEnum.applied,
+        email_sent=True,
+        created_at=_NOW,
+        updated_at=_NOW,
+    )
 
     # Validate using Pydantic V2's model_validate
     model = JobApplicationRead.model_validate(orm_obj)
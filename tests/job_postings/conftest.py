@@ -0,0 +1,88 @@
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domains.company_users.schemas import CompanyUserRegisterRequest
+from app.domains.company_users.service import register_company_user
+from app.domains.job_postings.repository import JobPostingRepository
+from app.models import CompanyInfo, CompanyUser
+from app.models.users import EmailVerification
+from tests._factories import VERIFIED_EMAIL_EXPIRES_AT
+
+
+async def fake_upload_image_to_ncp(file, folder):
+    return "https://fake-url.com/test.png"
+
+
+# 채용공고 라우터가 import해 둔 upload_image_to_ncp를 이 패키지 테스트 동안 가짜 구현으로 교체
+# (app.core.utils 쪽을 바꾸면 라우터에 이미 바인딩된 원본이 그대로 호출되어 실제 NCP로 업로드됨)
+@pytest.fixture(scope="package", autouse=True)
+def fake_ncp_upload():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "app.domains.job_postings.router.upload_image_to_ncp",
+            fake_upload_image_to_ncp,
+        )
+        yield
+
+
+@pytest_asyncio.fixture(scope="module")
+async def company_user(db_engine):
+    """
+    가입을 마친 기업 회원 (모듈당 한 번만 커밋해 두고 재사용,
+    테스트 안에서의 변경은 db_session 롤백으로 원복됨)
+    """
+    TestingSessionLocal = async_sessionmaker(
+        bind=db_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    company_data = CompanyUserRegisterRequest(
+        email=f"company_{uuid.uuid4().hex[:8]}@example.com",
+        password="testpassword",
+        confirm_password="testpassword",
+        manager_name="홍길동",
+        manager_phone="01099998888",
+        manager_email="manager2@example.com",
+        company_name="테스트 회사2",
+        ceo_name="대표자",
+        opening_date="20200101",
+        business_reg_number="1234567690",
+        company_intro="테스트 회사 소개입니다.",
+    )
+    async with TestingSessionLocal() as session:
+        # 기업 회원 가입 전 이메일 인증 완료 상태로 만들어 둠
+        await session.execute(
+            insert(EmailVerification).values(
+                email=company_data.email,
+                token="dummy-token",
+                is_verified=True,
+                user_type="company",
+                expires_at=VERIFIED_EMAIL_EXPIRES_AT,
+            )
+        )
+        await session.commit()
+        user = await register_company_user(session, company_data)
+        yield user
+
+        # 다음 모듈에서 같은 사업자번호로 다시 가입할 수 있도록 커밋해 둔 데이터 정리
+        # (채용공고는 company_users FK의 ON DELETE CASCADE로 함께 삭제됨)
+        await session.execute(delete(CompanyUser).where(CompanyUser.id == user.id))
+        await session.execute(
+            delete(CompanyInfo).where(CompanyInfo.id == user.company_id)
+        )
+        await session.execute(
+            delete(EmailVerification).where(
+                EmailVerification.email == company_data.email
+            )
+        )
+        await session.commit()
+
+
+@pytest.fixture
+def repository(db_session):
+    """테스트마다 롤백되는 db_session을 쓰는 채용공고 Repository"""
+    return JobPostingRepository(db_session)
@@ -16,55 +16,83 @@ from app.models.job_postings import (
 )
 
 # --- 테스트 데이터 생성 헬퍼 ---
+# 기본 공고 데이터는 모듈 로드 시 한 번만 생성 (날짜도 고정값 사용)
+_BASE_DATE = date(2025, 1, 1)
+_BASE_CREATE_DATA = {
+    "title": "기본 테스트 공고",
+    "recruit_period_start": _BASE_DATE,
+    "recruit_period_end": _BASE_DATE + timedelta(days=30),
+    "is_always_recruiting": False,
+    "education": EducationEnum.college_4,
+    "recruit_number": 1,
+    "benefits": "4대보험, 스톡옵션",
+    "preferred_conditions": "테스트 코드 작성",
+    "other_conditions": "긍정적인 태도",
+    "work_address": "서울시 테스트구 테스트동",
+    "work_place_name": "테스트 베이스 주식회사",
+    "payment_method": PaymentMethodEnum.yearly,
+    "job_category": JobCategoryEnum.it,
+    "work_duration": WorkDurationEnum.more_1_year,
+    "is_work_duration_negotiable": False,
+    "career": "3년 이상",
+    "employment_type": "정규직",
+    "salary": 60000000,
+    "work_days": "주 5일(월~금)",
+    "is_work_days_negotiable": False,
+    "is_schedule_based": False,
+    "work_start_time": "09:30",
+    "work_end_time": "18:30",
+    "is_work_time_negotiable": False,
+    "description": "상세 설명입니다.",
+    "summary": "요약글입니다.",
+    "latitude": 37.5665,
+    "longitude": 126.9780,
+}
+
+
 def get_base_create_data(**overrides) -> dict:
     """JobPostingCreate에 필요한 모든 필수/기본 필드를 포함한 딕셔너리 반환"""
-    data = {
-        "title": "기본 테스트 공고",
-        "recruit_period_start": date.today(),
-        "recruit_period_end": date.today() + timedelta(days=30),
-        "is_always_recruiting": False,
-        "education": EducationEnum.college_4,
-        "recruit_number": 1,
-        "benefits": "4대보험, 스톡옵션",
-        "preferred_conditions": "테스트 코드 작성",
-        "other_conditions": "긍정적인 태도",
-        "work_address": "서울시 테스트구 테스트동",
-        "work_place_name": "테스트 베이스 주식회사",
-        "payment_method": PaymentMethodEnum.yearly,
-        "job_category": JobCategoryEnum.it,
-        "work_duration": WorkDurationEnum.more_1_year,
-        "is_work_duration_negotiable": False,
-        "career": "3년 이상",
-        "employment_type": "정규직",
-        "salary": 60000000,
-        "work_days": "주 5일(월~금)",
-        "is_work_days_negotiable": False,
-        "is_schedule_based": False,
-        "work_start_time": "09:30",
-        "work_end_time": "18:30",
-        "is_work_time_negotiable": False,
-        "description": "상세 설명입니다.",
-        "summary": "요약글입니다.",
-        "latitude": 37.5665,
-        "longitude": 126.9780,
-    }
-    data.update(overrides)
-    return data
+    return {**_BASE_CREATE_DATA, **overrides}
+
+
+# 음수/타입 오류 테스트용: JobPostingCreate의 필수 필드만 담은 최소 데이터
+_REQUIRED_CREATE_FIELDS = (
+    "title",
+    "education",
+    "recruit_number",
+    "work_address",
+    "work_place_name",
+    "payment_method",
+    "job_category",
+    "career",
+    "employment_type",
+    "salary",
+)
+_MINIMAL_CREATE_DATA = {field: _BASE_CREATE_DATA[field] for field in _REQUIRED_CREATE_FIELDS}
+
+
+def get_minimal_invalid_data(field: str, value) -> dict:
+    """필수 필드만 채운 데이터에 잘못된 값 하나(field=value)를 넣어 반환"""
+    return {**_MINIMAL_CREATE_DATA, field: value}
 
 # --- JobPostingCreate 스키마 테스트 ---
 
-def test_job_posting_create_valid():
-    """유효한 데이터로 JobPostingCreate 스키마 생성 성공 테스트"""
-    valid_data = get_base_create_data()
+@pytest.fixture(scope="module")
+def base_valid_posting() -> JobPostingCreate:
+    """기본 데이터로 검증을 마친 JobPostingCreate (모듈당 한 번만 생성)"""
     try:
-        schema = JobPostingCreate(**valid_data)
-        # 주요 필드 값 확인
-        assert schema.title == valid_data["title"]
-        assert schema.salary == valid_data["salary"]
-        assert schema.education == EducationEnum.college_4
+        return JobPostingCreate(**_BASE_CREATE_DATA)
     except ValidationError as e:
         pytest.fail(f"유효한 데이터로 생성 실패: {e}")
 
+
+def test_job_posting_create_valid(base_valid_posting):
+    """유효한 데이터로 JobPostingCreate 스키마 생성 성공 테스트"""
+    # 주요 필드 값 확인
+    assert base_valid_posting.title == _BASE_CREATE_DATA["title"]
+    assert base_valid_posting.salary == _BASE_CREATE_DATA["salary"]
+    assert base_valid_posting.education == EducationEnum.college_4
+
 def test_job_posting_create_missing_required_field():
     """필수 필드 누락 시 ValidationError 발생 테스트"""
     invalid_data = get_base_create_data()
@@ -76,7 +104,7 @@ def test_job_posting_create_missing_required_field():
 
 def test_job_posting_create_invalid_type():
     """잘못된 타입의 데이터 입력 시 ValidationError 발생 테스트"""
-    invalid_data = get_base_create_data(salary="육천만원") # int여야 하는데 str 입력
+    invalid_data = get_minimal_invalid_data("salary", "육천만원") # int여야 하는데 str 입력
     with pytest.raises(ValidationError) as excinfo:
         JobPostingCreate(**invalid_data)
     # 'salary' 필드에서 타입 에러 발생 확인
@@ -84,7 +112,7 @@ def test_job_posting_create_invalid_type():
 
 def test_job_posting_create_invalid_enum():
     """잘못된 Enum 값 입력 시 ValidationError 발생 테스트"""
-    invalid_data = get_base_create_data(education="중졸") # EducationEnum에 없는 값
+    invalid_data = get_minimal_invalid_data("education", "중졸") # EducationEnum에 없는 값
     with pytest.raises(ValidationError) as excinfo:
         JobPostingCreate(**invalid_data)
     # 'education' 필드에서 enum 값 에러 발생 확인
@@ -93,7 +121,7 @@ def test_job_posting_create_invalid_enum():
 def test_job_posting_create_validator_negative_salary():
     """급여 필드 validator 테스트 (음수 입력 시 ValidationError)"""
     # 이 테스트는 salary 필드에 음수 값을 허용하지 않는 validator가 있다고 가정
-    invalid_data = get_base_create_data(salary=-1000000)
+    invalid_data = get_minimal_invalid_data("salary", -1000000)
     with pytest.raises(ValidationError) as excinfo:
         JobPostingCreate(**invalid_data)
     # salary 필드 관련 에러 메시지 확인 (validator 구현에 따라 메시지 내용 달라짐)
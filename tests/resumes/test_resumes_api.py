@@ -1,13 +1,13 @@
+import functools
 import json
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 
-@pytest.mark.asyncio
-async def test_resume_crud_with_exceptions(async_client: AsyncClient, user_token_and_id):
-    token, user_id, _ = user_token_and_id
 
-    # 이력서 생성
-    create_payload = {
+def _create_payload(user_id: int) -> dict:
+    """이력서 생성 요청 데이터"""
+    return {
         "user_id": user_id,
         "resume_image": "",
         "desired_area": "서울",
@@ -32,36 +32,53 @@ async def test_resume_crud_with_exceptions(async_client: AsyncClient, user_token
         ]
     }
 
+
+@functools.lru_cache(maxsize=4)
+def _create_body(user_id: int) -> str:
+    """multipart resume_data 필드용 생성 요청 JSON 문자열 (user_id별로 한 번만 직렬화)"""
+    return json.dumps(_create_payload(user_id))
+
+
+# 수정 요청 JSON 문자열은 모듈 로드 시 한 번만 직렬화
+_UPDATE_BODY = json.dumps({
+    "desired_area": "부산",
+    "introduction": "수정된 소개",
+    "educations": [],
+    "experiences": []
+})
+
+
+@pytest_asyncio.fixture
+async def created_resume(async_client: AsyncClient, user_token_and_id, user_auth_headers):
+    """테스트마다 생성되는 이력서 ID (db_session 롤백으로 원복됨)"""
+    _, user_id, _ = user_token_and_id
     create_resp = await async_client.post(
         "/resumes",
-        headers={"Authorization": f"Bearer {token}"},
-        data={"resume_data": json.dumps(create_payload)},
+        headers=user_auth_headers,
+        data={"resume_data": _create_body(user_id)},
         files={}
     )
     assert create_resp.status_code == 200
-    created_resume = create_resp.json()["data"]
-    resume_id = created_resume["id"]
+    return create_resp.json()["data"]["id"]
+
+
+@pytest.mark.asyncio
+async def test_resume_crud(async_client: AsyncClient, user_auth_headers, created_resume):
+    resume_id = created_resume
 
     # 이력서 조회
     get_resp = await async_client.get(
         "/resumes",
-        headers={"Authorization": f"Bearer {token}"}
+        headers=user_auth_headers
     )
     assert get_resp.status_code == 200
     assert get_resp.json()["data"]["desired_area"] == "서울"
 
     # 이력서 수정
-    update_payload = {
-        "desired_area": "부산",
-        "introduction": "수정된 소개",
-        "educations": [],
-        "experiences": []
-    }
-
     update_resp = await async_client.patch(
         f"/resumes/{resume_id}",
-        headers={"Authorization": f"Bearer {token}"},
-        data={"resume_data": json.dumps(update_payload)},
+        headers=user_auth_headers,
+        data={"resume_data": _UPDATE_BODY},
         files={}
     )
     assert update_resp.status_code == 200
@@ -71,7 +88,7 @@ async def test_resume_crud_with_exceptions(async_client: AsyncClient, user_token
     # 이력서 삭제
     delete_resp = await async_client.delete(
         f"/resumes/{resume_id}",
-        headers={"Authorization": f"Bearer {token}"}
+        headers=user_auth_headers
     )
     assert delete_resp.status_code == 200
     assert delete_resp.json()["message"] == "이력서가 삭제되었습니다."
@@ -79,44 +96,61 @@ async def test_resume_crud_with_exceptions(async_client: AsyncClient, user_token
     # 삭제 후 조회 시 404
     after_delete_resp = await async_client.get(
         "/resumes",
-        headers={"Authorization": f"Bearer {token}"}
+        headers=user_auth_headers
     )
     assert after_delete_resp.status_code == 404
 
-    # 존재하지 않는 이력서 수정 시도
-    wrong_update_resp = await async_client.patch(
-        f"/resumes/{resume_id}",
-        headers={"Authorization": f"Bearer {token}"},
-        data={"resume_data": json.dumps(update_payload)},
-        files={}
-    )
-    assert wrong_update_resp.status_code == 500 or wrong_update_resp.status_code == 404
 
-    # 존재하지 않는 이력서 삭제 시도
-    wrong_delete_resp = await async_client.delete(
-        f"/resumes/{resume_id}",
-        headers={"Authorization": f"Bearer {token}"}
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("PATCH", {"data": {"resume_data": _UPDATE_BODY}, "files": {}}),
+        ("DELETE", {}),
+    ],
+    ids=["update", "delete"],
+)
+async def test_resume_missing_resume(
+    async_client: AsyncClient, user_auth_headers, created_resume, method, kwargs
+):
+    """삭제된(존재하지 않는) 이력서 수정/삭제 시도"""
+    delete_resp = await async_client.delete(
+        f"/resumes/{created_resume}",
+        headers=user_auth_headers
     )
-    assert wrong_delete_resp.status_code in(404, 500)
+    assert delete_resp.status_code == 200
 
-    # 잘못된 토큰으로 생성 요청
-    bad_token_resp = await async_client.post(
-        "/resumes",
-        headers={"Authorization": "Bearer invalidtoken"},
-        data={"resume_data": json.dumps(create_payload)},
-        files={}
+    resp = await async_client.request(
+        method, f"/resumes/{created_resume}", headers=user_auth_headers, **kwargs
     )
-    assert bad_token_resp.status_code == 401
+    assert resp.status_code in (404, 500)
 
-    # 다른 user_id로 생성 요청
-    wrong_payload = dict(create_payload)
-    wrong_payload["user_id"] = 9999  # 다른 유저 ID로 조작
 
-    user_mismatch_resp = await async_client.post(
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "bad_token, user_id_override, expected_status",
+    [
+        (True, None, 401),  # 잘못된 토큰으로 생성 요청
+        (False, 9999, 400),  # 다른 user_id로 생성 요청
+    ],
+    ids=["bad_token", "user_mismatch"],
+)
+async def test_resume_create_rejected(
+    async_client: AsyncClient,
+    user_token_and_id,
+    user_auth_headers,
+    bad_token,
+    user_id_override,
+    expected_status,
+):
+    _, user_id, _ = user_token_and_id
+    headers = {"Authorization": "Bearer invalidtoken"} if bad_token else user_auth_headers
+    resp = await async_client.post(
         "/resumes",
-        headers={"Authorization": f"Bearer {token}"},
-        data={"resume_data": json.dumps(wrong_payload)},
+        headers=headers,
+        data={"resume_data": _create_body(user_id_override or user_id)},
         files={}
     )
-    assert user_mismatch_resp.status_code == 400
-    assert "사용자 ID가 일치하지 않습니다" in user_mismatch_resp.text
\ No newline at end of file
+    assert resp.status_code == expected_status
+    if expected_status == 400:
+        assert "사용자 ID가 일치하지 않습니다" in resp.text
@@ -0,0 +1,153 @@
+from datetime import date
+
+import pytest_asyncio
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+# 채용공고 모델·Enum은 모듈째 가져와 사용 (import 줄이 길어져 줄바꿈되지 않도록)
+from app.models import CompanyInfo, CompanyUser, Interest, job_postings
+from app.models.users import EmailVerification, User
+from app.models.users_interests import UserInterest
+from tests._factories import VERIFIED_EMAIL_EXPIRES_AT, VERIFIED_EMAIL_INSERT
+from tests._password_helpers import fake_hash_password
+
+# 모듈마다 한 번만 가입시켜 두는 일반 회원 정보 (test_register_user의 hong@example.com과 겹치지 않게)
+REGISTERED_USER = {
+    "name": "홍길동",
+    "email": "registered@example.com",
+    "password": "password123",
+    "phone_number": "010-1234-5678",
+    "birthday": "1990-01-01",
+}
+
+
+# test_register_user가 HTTP로 가입시키는 이메일 (가입 자체는 db_session 롤백으로 원복됨)
+NEW_USER_EMAIL = "hong@example.com"
+
+
+@pytest_asyncio.fixture(scope="module")
+async def verified_email(db_engine):
+    """
+    인증 완료된 이메일 (모듈당 한 번만 커밋해 두고 재사용,
+    이 이메일로 가입하는 테스트의 변경은 db_session 롤백으로 원복됨)
+    """
+    TestingSessionLocal = async_sessionmaker(
+        bind=db_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    async with TestingSessionLocal() as session:
+        await session.execute(
+            VERIFIED_EMAIL_INSERT,
+            {
+                "email": NEW_USER_EMAIL,
+                "token": "dummy-token",
+                "expires_at": VERIFIED_EMAIL_EXPIRES_AT,
+            },
+        )
+        await session.commit()
+        yield NEW_USER_EMAIL
+
+        await session.execute(
+            delete(EmailVerification).where(EmailVerification.email == NEW_USER_EMAIL)
+        )
+        await session.commit()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def registered_user(db_engine):
+    """
+    가입을 마친 활성 사용자 (모듈당 한 번만 커밋해 두고 재사용,
+    테스트 안에서의 변경은 db_session 롤백으로 원복됨)
+    """
+    TestingSessionLocal = async_sessionmaker(
+        bind=db_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    async with TestingSessionLocal() as session:
+        # 가입 API/서비스를 거치지 않고 INSERT 한 번으로 생성
+        # (로그인·재설정·이메일 찾기는 인증 정보 없이 users 행만 보면 되고,
+        #  비밀번호는 세션 동안 패치된 가짜 해시와 같은 형식으로 저장)
+        result = await session.execute(
+            insert(User)
+            .values(
+                name=REGISTERED_USER["name"],
+                email=REGISTERED_USER["email"],
+                password=fake_hash_password(REGISTERED_USER["password"]),
+                phone_number=REGISTERED_USER["phone_number"],
+                birthday=REGISTERED_USER["birthday"],
+                is_active=True,
+            )
+            .returning(User.id)
+        )
+        user_id = result.scalar_one()
+        await session.commit()
+        # 비밀번호 재설정 테스트가 /user/password/verify 없이 바로 쓸 수 있도록 id도 함께 반환
+        yield {**REGISTERED_USER, "id": user_id}
+
+        # 다음 모듈에서 같은 이메일로 다시 가입할 수 있도록 커밋해 둔 데이터 정리
+        await session.execute(delete(User).where(User.id == user_id))
+        await session.commit()
+
+
+@pytest_asyncio.fixture
+async def user_with_interests(db_session, user_token_and_id):
+    """
+    공유 테스트 유저에 관심분야(IT·인터넷)를 달고 같은 직종의 채용공고를 만들어 둠
+    (추천 API가 항상 200을 돌려주도록, db_session 롤백으로 원복됨)
+    """
+    _, user_id, _ = user_token_and_id
+    interest = Interest(
+        code="test_recommend_it", name=job_postings.JobCategoryEnum.it.value
+    )
+    company = CompanyInfo(
+        company_name="추천테스트회사",
+        ceo_name="홍길동",
+        business_reg_number="7771234860",
+        opening_date="2020-01-01",
+        company_intro="추천 테스트용 회사입니다.",
+        manager_name="김담당",
+        manager_phone="01012345678",
+        manager_email="recommend@example.com",
+    )
+    db_session.add_all([interest, company])
+    await db_session.flush()  # interest.id, company.id 확보
+
+    comp_user = CompanyUser(
+        email="recommend_company@example.com",
+        password="qwe123!@#",
+        company_id=company.id,
+    )
+    db_session.add(comp_user)
+    await db_session.flush()  # comp_user.id 확보
+
+    posting = job_postings.JobPosting(
+        title="추천테스트공고",
+        company_id=company.id,
+        author_id=comp_user.id,
+        recruit_period_start=date(2025, 5, 1),
+        recruit_period_end=date(2025, 6, 1),
+        is_always_recruiting=False,
+        education=job_postings.EducationEnum.college_4,
+        recruit_number=1,
+        payment_method=job_postings.PaymentMethodEnum.monthly,
+        job_category=job_postings.JobCategoryEnum.it,
+        work_duration=job_postings.WorkDurationEnum.more_6_months,
+        is_work_duration_negotiable=False,
+        career="무관",
+        employment_type="정규직",
+        salary=3000,
+        work_days="월~금",
+        is_work_days_negotiable=False,
+        is_schedule_based=False,
+        work_address="서울시 강남구",
+        work_place_name="본사",
+        is_work_time_negotiable=False,
+        postings_image="https://example.com/default.png",
+    )
+    db_session.add_all(
+        [UserInterest(user_id=user_id, interest_id=interest.id), posting]
+    )
+    await db_session.flush()  # 같은 세션을 쓰는 추천 API에는 커밋 없이도 보임
+    return posting
@@ -1,25 +1,17 @@
-from app.models.users import User, GenderEnum
+from app.models.users import GenderEnum
 from app.core.datetime_utils import get_now_utc
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from tests._factories import build_user
+
 @pytest.mark.asyncio
 async def test_user_model_fields(db_session: AsyncSession):
-    # 사용자 객체 생성
-    user = User(
-        name="홍길동",  # 사용자 이름
-        email="test@example.com",  # 이메일
-        password="hashedpassword",  # 비밀번호
-        phone_number="010-1234-5678",  # 전화번호
-        birthday="1990-01-01",  # 생년월일
-        gender=GenderEnum.male,  # 성별
-        signup_purpose="정보 탐색",  # 가입 목적
-        referral_source="블로그",  # 유입 경로
-    )
+    # 사용자 객체 생성 (기본 필드 값은 tests/_factories.py의 build_user가 채움)
+    user = build_user()
 
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.commit()  # expire_on_commit=False라 refresh 없이 속성 그대로 사용
 
     # 필드 검증
     assert user.name == "홍길동"
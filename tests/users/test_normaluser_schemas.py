@@ -1,22 +1,17 @@
 import pytest
-from app.models.users import User, GenderEnum
+from app.models.users import GenderEnum
 from app.core.datetime_utils import get_now_utc
 from datetime import datetime
 
+from tests._factories import build_user
+
 def test_user_model_fields():
     # 사용자 객체 생성
-    user = User(
-        name="홍길동",  # 사용자 이름
-        email="test@example.com",  # 이메일
-        password="hashedpassword",  # 비밀번호
-        phone_number="010-1234-5678",  # 전화번호
-        birthday="1990-01-01",  # 생년월일
-        gender=GenderEnum.male,  # 성별
-        signup_purpose="정보 탐색",  # 가입 목적
-        referral_source="블로그",  # 유입 경로
+    now = datetime.now()
+    user = build_user(
         is_active=True,  # 활성 상태
-        created_at=datetime.now(),
-        updated_at=datetime.now()
+        created_at=now,
+        updated_at=now,
     )
 
     # 필드 검증
@@ -1,98 +1,68 @@
+import functools
+import json
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, insert
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 
-from app.models import User
-from app.models.users import EmailVerification
+from tests._factories import VERIFIED_EMAIL_INSERT
 
+# 만료된 이메일 인증 정보의 유효기간 (expires_at 컬럼이 timezone 없는 DateTime이라 naive로 지정)
+_EXPIRED_AT = datetime(2024, 12, 31, 23, 59)
 
-class TestUserEndpoints:
+_JSON_HEADERS = {"content-type": "application/json"}
 
-    @pytest.mark.asyncio
-    async def test_register_user(self, async_client: AsyncClient, db_session: AsyncSession):
-        # 이메일 인증 정보 DB에 삽입 (인증 완료 상태)
-        await db_session.execute(
-            insert(EmailVerification).values(
-                email="hong@example.com",
-                token="dummy-token",
-                is_verified=True,
-                user_type="user",
-                expires_at=datetime.now() + timedelta(minutes=30)
-            )
-        )
-        await db_session.commit()  # DB 변경사항 커밋
 
-        # 회원가입 요청에 사용할 페이로드 정의
-        payload = {
-            "name": "홍길동",  # 사용자 이름
-            "email": "hong@example.com",  # 이메일
-            "password": "password123",  # 비밀번호
-            "phone_number": "010-1234-5678",  # 전화번호
-            "birthday": "1990-01-01",  # 생년월일
-            "gender": "남성",  # 성별
-            "signup_purpose": "취업",  # 가입 목적
-            "referral_source": "구글 검색",  # 유입 경로
-            "interests": ["운전·배달", "전문-생산직"]  # 관심 분야
-        }
-        response = await async_client.post("/user/register", json=payload)  # 회원가입 요청 전송
-        assert response.status_code == 200  # 정상 등록 응답 확인
-        assert response.json()["status"] == "success"  # 성공 상태 메시지 확인
+@functools.lru_cache(maxsize=4)
+def _register_body(email: str) -> bytes:
+    """회원가입 요청 JSON 본문 (이메일별로 한 번만 직렬화)"""
+    return json.dumps({
+        "name": "홍길동",  # 사용자 이름
+        "email": email,  # 이메일
+        "password": "password123",  # 비밀번호
+        "phone_number": "010-1234-5678",  # 전화번호
+        "birthday": "1990-01-01",  # 생년월일
+        "gender": "남성",  # 성별
+        "signup_purpose": "취업",  # 가입 목적
+        "referral_source": "구글 검색",  # 유입 경로
+        "interests": ["운전·배달", "전문-생산직"]  # 관심 분야
+    }).encode("utf-8")
 
 
-    @pytest.mark.asyncio
-    async def test_login_user(self, async_client: AsyncClient, db_session: AsyncSession):
-        # 이메일 인증 정보 DB에 삽입 (인증 완료 상태)
-        await db_session.execute(
-            insert(EmailVerification).values(
-                email="hong@example.com",
-                token="dummy-token",
-                is_verified=True,
-                user_type="user",
-                expires_at=datetime.now() + timedelta(minutes=30)
-            )
-        )
-        await db_session.commit()  # DB 변경사항 커밋
+# 클래스 전체에 한 번만 표시 (루프 범위는 pyproject의 세션 루프 설정을 따름,
+#  세션 범위 픽스처와 같은 루프를 써야 하므로 loop_scope="class"로 좁히지 않음)
+@pytest.mark.asyncio
+class TestUserEndpoints:
 
-        # 회원가입 요청 전송 (로그인 테스트를 위한 사용자 생성)
-        await async_client.post("/user/register", json={
-            "name": "홍길동",  # 사용자 이름
-            "email": "hong@example.com",  # 이메일
-            "password": "password123",  # 비밀번호
-            "phone_number": "010-1234-5678",  # 전화번호
-            "birthday": "1990-01-01",  # 생년월일
-        })
+    async def test_register_user(self, async_client: AsyncClient, verified_email):
+        # 이메일 인증은 verified_email 픽스처가 모듈당 한 번만 처리
+        # 회원가입 요청 전송 (직렬화된 JSON 본문을 그대로 사용)
+        response = await async_client.post(
+            "/user/register", content=_register_body(verified_email), headers=_JSON_HEADERS
+        )
+        assert response.status_code == 200  # 정상 등록 응답 확인
+        assert response.json()["status"] == "success"  # 성공 상태 메시지 확인
 
-        # DB에서 해당 이메일 사용자 조회
-        result = await db_session.execute(select(User).where(User.email == "hong@example.com"))
-        user = result.scalar_one()
-        user.is_active = True  # 사용자 활성화 처리 (이메일 인증 완료 상태로 변경)
-        await db_session.commit()  # 변경사항 커밋
 
+    async def test_login_user(self, async_client: AsyncClient, registered_user):
+        # registered_user 픽스처가 활성 상태(is_active=True)로 가입시켜 두므로 별도 활성화 불필요
         # 로그인 요청 전송
         response = await async_client.post("/user/login", json={
-            "email": "hong@example.com",  # 이메일
-            "password": "password123"  # 비밀번호
+            "email": registered_user["email"],  # 이메일
+            "password": registered_user["password"]  # 비밀번호
         })
         assert response.status_code == 200  # 로그인 성공 응답 확인
         assert "accesstoken" in response.json()["data"]  # 액세스 토큰 포함 여부 확인
 
 
-    @pytest.mark.asyncio
     async def test_login_user_expired_token(self, async_client: AsyncClient, db_session: AsyncSession):
-        # 만료된 이메일 인증 토큰 생성 (현재 시간보다 1분 이전)
-        expired_time = datetime.now(timezone.utc) - timedelta(minutes=1)
+        # 만료된 이메일 인증 토큰 생성 (고정된 과거 시각이라 실행 시각과 무관하게 항상 만료 상태)
         await db_session.execute(
-            insert(EmailVerification).values(
-                email="expired@example.com",
-                token="expired-token",
-                is_verified=True,
-                user_type="user",
-                expires_at=expired_time
-            )
+            VERIFIED_EMAIL_INSERT,
+            {"email": "expired@example.com", "token": "expired-token", "expires_at": _EXPIRED_AT}
         )
-        await db_session.commit()  # DB 변경사항 커밋
+        await db_session.flush()  # 커밋 없이도 같은 세션을 쓰는 엔드포인트에 보임 (테스트 종료 시 롤백)
 
         # 만료된 토큰으로 로그인 시도
         response = await async_client.post("/user/login", json={
@@ -101,92 +71,28 @@ class TestUserEndpoints:
         })
         assert response.status_code == 401  # 인증 실패(토큰 만료) 상태코드 확인
 
-    @pytest.mark.asyncio
-    async def test_login_user_invalid_token_format(self, async_client: AsyncClient):
-        # 잘못된 형식의 JWT 토큰을 가진 Authorization 헤더로 사용자 정보 조회 요청
-        response = await async_client.get(
-            "/user/me", headers={"Authorization": "Bearer not.a.jwt"}
-        )
-        assert response.status_code == 401  # 인증 실패 상태코드 확인
-
-    @pytest.mark.asyncio
-    async def test_get_me_without_token(self, async_client: AsyncClient):
-        # 인증 토큰 없이 사용자 정보 조회 요청
-        response = await async_client.get("/user/me")
-        assert response.status_code == 422  # 인증 실패 상태코드 확인
-
-    @pytest.mark.asyncio
-    async def test_password_reset_confirm_wrong_token(self, async_client: AsyncClient):
-        # 존재하지 않는 사용자 ID로 비밀번호 재설정 요청 페이로드 정의
-        payload = {
-            "user_id": 999999,  # 존재하지 않는 ID
-            "new_password": "newpass123",  # 새 비밀번호
-            "confirm_password": "newpass123"  # 비밀번호 확인
-        }
-        # 비밀번호 재설정 요청 전송
-        response = await async_client.post("/user/password/reset", json=payload)
-        assert response.status_code in [400, 404]  # 잘못된 요청 또는 사용자 없음 응답 확인
-
-    @pytest.mark.asyncio
-    async def test_password_reset_confirm_mismatched_passwords(self, async_client: AsyncClient, db_session: AsyncSession):
-        # 이메일 인증 정보 DB에 삽입 (인증 완료 상태)
-        await db_session.execute(
-            insert(EmailVerification).values(
-                email="mismatch@example.com",
-                token="dummy-token",
-                is_verified=True,
-                user_type="user",
-                expires_at=datetime.now(timezone.utc) + timedelta(minutes=30)
-            )
-        )
-        await db_session.commit()  # DB 변경사항 커밋
-
-        # 회원가입 요청 전송
-        register_resp = await async_client.post("/user/register", json={
-            "name": "홍길동",  # 사용자 이름
-            "email": "mismatch@example.com",  # 이메일
-            "password": "password123",  # 비밀번호
-            "phone_number": "010-1234-5678",  # 전화번호
-            "birthday": "1990-01-01"  # 생년월일
-        })
-
-        # 비밀번호 재설정 전 검증 요청 전송
-        verify_resp = await async_client.post("/user/password/verify", json={
-            "email": "mismatch@example.com",  # 이메일
-            "name": "홍길동",  # 이름
-            "phone_number": "010-1234-5678",  # 전화번호
-            "birthday": "1990-01-01"  # 생년월일
-        })
-        if verify_resp.status_code != 200:
-            pytest.fail("비밀번호 검증 실패")  # 검증 실패 시 테스트 중단
-
-        user_id = verify_resp.json()["data"]["user_id"]  # 사용자 ID 추출
-
-        # 비밀번호와 확인 비밀번호가 일치하지 않는 페이로드 정의
-        payload = {
-            "user_id": user_id,  # 사용자 ID
-            "new_password": "newpass123",  # 새 비밀번호
-            "confirm_password": "differentpass"  # 확인 비밀번호 (불일치)
-        }
-        # 비밀번호 재설정 요청 전송
-        response = await async_client.post("/user/password/reset", json=payload)
-        assert response.status_code == 400  # 비밀번호 불일치로 인한 실패 상태코드 확인
-
-
-    @pytest.mark.asyncio
-    async def test_get_me(self, async_client: AsyncClient, user_token_and_id):
-        token, _, _ = user_token_and_id  # 액세스 토큰 및 사용자 정보 추출
+    @pytest.mark.parametrize(
+        "headers, expected_status",
+        [
+            ({"Authorization": "Bearer not.a.jwt"}, 401),  # 잘못된 형식의 JWT 토큰
+            ({}, 422),  # 인증 토큰 없음 (Authorization 헤더 누락)
+        ],
+        ids=["invalid_token_format", "without_token"],
+    )
+    async def test_get_me_auth_errors(self, async_client: AsyncClient, headers, expected_status):
+        # 인증 정보가 잘못되었거나 없는 상태로 사용자 정보 조회 요청
+        response = await async_client.get("/user/me", headers=headers)
+        assert response.status_code == expected_status  # 인증 실패 상태코드 확인
+
+    async def test_get_me(self, async_client: AsyncClient, user_auth_headers):
         # 인증 헤더를 포함하여 사용자 정보 조회 요청
-        response = await async_client.get(
-            "/user/me", headers={"Authorization": f"Bearer {token}"}
-        )
+        response = await async_client.get("/user/me", headers=user_auth_headers)
         assert response.status_code == 200  # 성공 상태코드 확인
         assert response.json()["email"]  # 이메일 정보 존재 여부 확인
 
 
-    @pytest.mark.asyncio
-    async def test_update_profile(self, async_client: AsyncClient, user_token_and_id):
-        token, user_id, _ = user_token_and_id  # 토큰 및 사용자 ID 추출
+    async def test_update_profile(self, async_client: AsyncClient, user_token_and_id, user_auth_headers):
+        _, user_id, _ = user_token_and_id  # 사용자 ID 추출
         # 프로필 업데이트 요청 페이로드 정의
         payload = {
             "name": "홍수정",  # 변경할 이름
@@ -194,143 +100,77 @@ class TestUserEndpoints:
         }
         # 인증 헤더 포함하여 사용자 프로필 수정 요청 전송
         response = await async_client.patch(
-            f"/user/{user_id}", json=payload, headers={"Authorization": f"Bearer {token}"}
+            f"/user/{user_id}", json=payload, headers=user_auth_headers
         )
         assert response.status_code == 200  # 성공 상태코드 확인
         assert response.json()["data"]["name"] == "홍수정"  # 이름 변경 반영 여부 확인
 
 
-    @pytest.mark.asyncio
-    async def test_recommend_jobs(self, async_client: AsyncClient, user_token_and_id):
-        token, _, _ = user_token_and_id  # 액세스 토큰 추출
-        # 관심 공고 추천 요청 (인증 헤더 포함)
-        response = await async_client.get(
-            "/user/recommend", headers={"Authorization": f"Bearer {token}"}
-        )
-        assert response.status_code in [200, 404]  # 관심공고 없으면 404 가능, 성공도 가능
-
+    async def test_recommend_jobs(self, async_client: AsyncClient, user_auth_headers, user_with_interests):
+        # 관심 공고 추천 요청 (인증 헤더 포함, 관심분야와 맞는 공고는 user_with_interests가 준비)
+        response = await async_client.get("/user/recommend", headers=user_auth_headers)
+        assert response.status_code == 200  # 관심분야와 맞는 공고가 있으므로 항상 성공
+        assert user_with_interests.id in {job["job_id"] for job in response.json()["data"]}
 
-    @pytest.mark.asyncio
-    async def test_password_reset_verify(self, async_client: AsyncClient, db_session: AsyncSession):
-        # 이메일 인증 정보 DB에 삽입 (인증 완료 상태)
-        await db_session.execute(
-            insert(EmailVerification).values(
-                email="hong@example.com",
-                token="dummy-token",
-                is_verified=True,
-                user_type="user",
-                expires_at=datetime.now() + timedelta(minutes=30)
-            )
-        )
-        await db_session.commit()  # DB 변경사항 커밋
-
-        # 회원가입 요청 전송
-        await async_client.post("/user/register", json={
-            "name": "홍길동",  # 사용자 이름
-            "email": "hong@example.com",  # 이메일
-            "password": "password123",  # 비밀번호
-            "phone_number": "010-1234-5678",  # 전화번호
-            "birthday": "1990-01-01"  # 생년월일
-        })
 
+    async def test_password_reset_verify(self, async_client: AsyncClient, registered_user):
         # 비밀번호 재설정 검증 요청 페이로드 정의
         payload = {
-            "email": "hong@example.com",  # 이메일
-            "name": "홍길동",  # 이름
-            "phone_number": "010-1234-5678",  # 전화번호
-            "birthday": "1990-01-01"  # 생년월일
+            "email": registered_user["email"],  # 이메일
+            "name": registered_user["name"],  # 이름
+            "phone_number": registered_user["phone_number"],  # 전화번호
+            "birthday": registered_user["birthday"]  # 생년월일
         }
         response = await async_client.post("/user/password/verify", json=payload)  # 검증 요청 전송
         assert response.status_code == 200  # 성공 상태코드 확인
 
-    @pytest.mark.asyncio
-    async def test_password_reset_confirm(self, async_client: AsyncClient, db_session: AsyncSession):
-        # 이메일 인증 정보 DB에 삽입 (인증 완료 상태)
-        await db_session.execute(
-            insert(EmailVerification).values(
-                email="hong@example.com",
-                token="dummy-token",
-                is_verified=True,
-                user_type="user",
-                expires_at=datetime.now() + timedelta(minutes=30)
-            )
-        )
-        await db_session.commit()  # DB 변경사항 커밋
-
-        # 회원가입 요청 전송
-        await async_client.post("/user/register", json={
-            "name": "홍길동",  # 사용자 이름
-            "email": "hong@example.com",  # 이메일
-            "password": "password123",  # 비밀번호
-            "phone_number": "010-1234-5678",  # 전화번호
-            "birthday": "1990-01-01"  # 생년월일
-        })
-
-        # 비밀번호 재설정 검증 요청 전송
-        verify_response = await async_client.post("/user/password/verify", json={
-            "email": "hong@example.com",  # 이메일
-            "name": "홍길동",  # 이름
-            "phone_number": "010-1234-5678",  # 전화번호
-            "birthday": "1990-01-01"  # 생년월일
-        })
-        if verify_response.status_code != 200:
-            pytest.fail(f"비밀번호 검증 실패: {verify_response.json()}")  # 실패 시 테스트 중단
-
-        user_id = verify_response.json()["data"]["user_id"]  # 사용자 ID 추출
-
-        # 비밀번호 재설정 요청 페이로드 정의
+    @pytest.mark.parametrize(
+        "new_password, confirm_password, user_id_override, expected_status",
+        [
+            ("newpass123", "newpass123", None, 200),  # 정상 재설정
+            ("newpass123", "differentpass", None, 400),  # 확인 비밀번호 불일치
+            ("newpass123", "newpass123", 999999, 404),  # 존재하지 않는 사용자 ID
+        ],
+        ids=["success", "mismatched_passwords", "wrong_user"],
+    )
+    async def test_password_reset_confirm(
+        self,
+        async_client: AsyncClient,
+        registered_user,
+        new_password,
+        confirm_password,
+        user_id_override,
+        expected_status,
+    ):
+        # 비밀번호 재설정 요청 페이로드 정의 (가입은 registered_user 픽스처가 모듈당 한 번만 처리)
         payload = {
-            "user_id": user_id,  # 사용자 ID
-            "new_password": "newpass123",  # 새 비밀번호
-            "confirm_password": "newpass123"  # 확인 비밀번호
+            "user_id": user_id_override or registered_user["id"],  # 사용자 ID
+            "new_password": new_password,  # 새 비밀번호
+            "confirm_password": confirm_password  # 확인 비밀번호
         }
 
         # 비밀번호 재설정 요청 전송
         response = await async_client.post("/user/password/reset", json=payload)
-        assert response.status_code == 200  # 성공 상태코드 확인
-        assert response.json()["message"] == "비밀번호가 재설정되었습니다."  # 성공 메시지 확인
-
+        assert response.status_code == expected_status  # 상태코드 확인
+        if expected_status == 200:
+            assert response.json()["message"] == "비밀번호가 재설정되었습니다."  # 성공 메시지 확인
 
-    @pytest.mark.asyncio
-    async def test_find_email(self, async_client: AsyncClient, db_session: AsyncSession):
-        # 이메일 인증 정보 DB에 삽입 (인증 완료 상태)
-        await db_session.execute(
-            insert(EmailVerification).values(
-                email="hong@example.com",
-                token="dummy-token",
-                is_verified=True,
-                user_type="user",
-                expires_at=datetime.now() + timedelta(minutes=30)
-            )
-        )
-        await db_session.commit()  # DB 변경사항 커밋
-
-        # 회원가입 요청 전송
-        await async_client.post("/user/register", json={
-            "name": "홍길동",  # 사용자 이름
-            "email": "hong@example.com",  # 이메일
-            "password": "password123",  # 비밀번호
-            "phone_number": "010-1234-5678",  # 전화번호
-            "birthday": "1990-01-01"  # 생년월일
-        })
 
+    async def test_find_email(self, async_client: AsyncClient, registered_user):
         # 이메일 찾기 요청 페이로드 정의
         payload = {
-            "name": "홍길동",  # 이름
-            "phone_number": "010-1234-5678",  # 전화번호
-            "birthday": "1990-01-01"  # 생년월일
+            "name": registered_user["name"],  # 이름
+            "phone_number": registered_user["phone_number"],  # 전화번호
+            "birthday": registered_user["birthday"]  # 생년월일
         }
         response = await async_client.post("/user/find_email", json=payload)  # 이메일 찾기 요청 전송
         assert response.status_code == 200  # 성공 상태코드 확인
         assert "email" in response.json()["data"]  # 이메일 정보 포함 여부 확인
 
 
-    @pytest.mark.asyncio
-    async def test_delete_user(self, async_client: AsyncClient, user_token_and_id):
-        token, user_id, _ = user_token_and_id  # 토큰 및 사용자 ID 추출
+    async def test_delete_user(self, async_client: AsyncClient, user_token_and_id, user_auth_headers):
+        _, user_id, _ = user_token_and_id  # 사용자 ID 추출
         # 인증 헤더 포함하여 사용자 삭제 요청 전송
-        response = await async_client.delete(
-            f"/user/{user_id}", headers={"Authorization": f"Bearer {token}"}
-        )
+        response = await async_client.delete(f"/user/{user_id}", headers=user_auth_headers)
         assert response.status_code == 200  # 성공 상태코드 확인
         assert response.json()["message"] == "회원탈퇴가 정상적으로 처리되었습니다."  # 성공 메시지 확인